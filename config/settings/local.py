@@ -33,6 +33,9 @@ CACHES = {
         "LOCATION": "",
     },
 }
+# LocMemCache is per process, so a cached_db session saved by one worker would
+# go stale in the others; keep sessions in the database here.
+SESSION_ENGINE = "django.contrib.sessions.backends.db"
 
 # EMAIL
 # ------------------------------------------------------------------------------
@@ -32,3 +32,16 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
 # file. This includes Django's development server, if the WSGI_APPLICATION
 # setting points here.
 application = get_wsgi_application()
+
+# Build the URL resolver's reverse tables and compile the route regexes at
+# worker boot instead of on the first request each worker serves. Reversing
+# one name per namespace fills the root table and the portal/users ones.
+# Done here rather than in an AppConfig.ready() so management commands don't
+# pay for loading the URLconf.
+from django.conf import settings  # noqa: E402
+
+if not settings.DEBUG:
+    from django.urls import reverse  # noqa: E402
+
+    for _url_name in ("home", "users:dashboard", "portal:program_catalog"):
+        reverse(_url_name)
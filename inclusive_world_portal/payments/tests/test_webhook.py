@@ -9,3 +9,16 @@ def test_webhook_signature_ok(client, monkeypatch):
     monkeypatch.setattr("stripe.Webhook.construct_event", fake_construct_event)
     r = client.post(reverse("stripe-webhook"), data=b"{}", content_type="application/json")
     assert r.status_code == 200
+
+@pytest.mark.django_db
+def test_webhook_payment_intent_succeeded_queues_fulfillment(client, monkeypatch):
+    def fake_construct_event(payload, sig, secret):
+        return {"type": "payment_intent.succeeded", "data": {"object": {"id": "pi_123"}}}
+    queued = []
+    monkeypatch.setattr("stripe.Webhook.construct_event", fake_construct_event)
+    monkeypatch.setattr(
+        "inclusive_world_portal.portal.tasks.fulfill_enrollment_payment.delay", queued.append
+    )
+    r = client.post(reverse("stripe-webhook"), data=b"{}", content_type="application/json")
+    assert r.status_code == 200
+    assert queued == ["pi_123"]
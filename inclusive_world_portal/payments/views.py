@@ -4,6 +4,8 @@ from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.views.decorators.csrf import csrf_exempt
 
+from inclusive_world_portal.portal.tasks import fulfill_enrollment_payment
+
 stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
 
 def create_checkout(request):
@@ -30,4 +32,7 @@ def stripe_webhook(request):
     if event["type"] == "checkout.session.completed":
         # TODO: fulfill/activate
         pass
+    elif event["type"] == "payment_intent.succeeded":
+        # Portal checkout; enrollments are created off the request path
+        fulfill_enrollment_payment.delay(event["data"]["object"]["id"])
     return HttpResponse(status=200)
@@ -18,7 +18,22 @@ class EnrollmentAdmin(ImportExportModelAdmin):
 admin.site.register(AttendanceRecord)
 admin.site.register(ProgramVolunteerLead)
 admin.site.register(BuddyAssignment)
-admin.site.register(Payment)
+
+
+@admin.register(Payment)
+class PaymentAdmin(admin.ModelAdmin):
+    list_display = ("payment_id", "amount", "currency", "status", "created_at")
+    list_filter = ("status", "currency")
+    search_fields = ("stripe_payment_intent_id",)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Only the changelist is trimmed; the change form shows every field,
+        # and each deferred one would cost its own SELECT there
+        match = request.resolver_match
+        if match is not None and match.url_name == f"{self.opts.app_label}_{self.opts.model_name}_changelist":
+            queryset = queryset.for_list()
+        return queryset
 
 # polish the admin UI 
 
@@ -105,4 +120,6 @@ class DocumentAdmin(admin.ModelAdmin):
         }),
     )
 
-
+    def get_queryset(self, request):
+        # The change form edits the HTML body, so load it up front
+        return super().get_queryset(request).with_content()
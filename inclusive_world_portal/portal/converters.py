@@ -0,0 +1,22 @@
+"""
+Path converters for the portal URLconf.
+"""
+
+
+class UUIDStringConverter:
+    """
+    Match a canonical (lowercase, hyphenated) UUID and pass it to the view as
+    a string.
+
+    Same pattern as Django's ``uuid`` converter, but skips building a
+    ``uuid.UUID`` per request: the views only use the value as a lookup key,
+    and the ORM casts the string when querying.
+    """
+
+    regex = "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return str(value)
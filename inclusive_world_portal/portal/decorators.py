@@ -0,0 +1,67 @@
+"""
+View decorators for the portal app.
+"""
+from functools import wraps
+
+from django.contrib import messages
+from django.http import JsonResponse
+from django.shortcuts import redirect
+
+from .models import EnrollmentSettings, VOLUNTEER_ROLES
+from .reversers import redirect_to
+
+_CLOSED_REDIRECT_BY_ROLE = {
+    'manager': 'users:manager_dashboard',
+    'person_centered_manager': 'users:pcm_dashboard',
+}
+
+
+def require_enrollment_open(action, roles=None, json_response=False):
+    """
+    Gate an enrollment view on, in order: the user's role (when ``roles`` is
+    given), their enrollment requirements, and enrollment being open.
+
+    ``action`` finishes the "Please complete the following before ..."
+    warning. Without ``roles`` this is the member flow and a closed
+    enrollment sends users to the member dashboard; otherwise to their own
+    role's dashboard. With ``json_response`` (for AJAX endpoints) a failed
+    check is a JSON 403 instead of a flash message and redirect. The
+    settings are attached as ``request.enrollment_settings``.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            user = request.user
+            role = user.role
+            if roles is not None and role not in roles:
+                if json_response:
+                    return JsonResponse({'error': 'Not allowed for your role'}, status=403)
+                messages.error(request, "This page is only accessible to volunteers, managers, and person-centered managers.")
+                return redirect_to('home')
+            
+            # Check if user meets enrollment requirements
+            meets_requirements, missing_items = user.enrollment_requirements_status
+            if not meets_requirements:
+                if json_response:
+                    return JsonResponse({'error': 'Enrollment requirements not met'}, status=403)
+                messages.warning(
+                    request,
+                    f"Please complete the following before {action}: {', '.join(missing_items)}"
+                )
+                return redirect('users:detail', username=user.username)
+            
+            # Check if enrollment is open
+            enrollment_settings = EnrollmentSettings.get_settings()
+            if not enrollment_settings.enrollment_open:
+                reason = enrollment_settings.closure_reason or "Registration is currently closed."
+                if json_response:
+                    return JsonResponse({'error': reason}, status=403)
+                messages.info(request, reason)
+                if roles is None:
+                    return redirect_to('users:member_dashboard')
+                return redirect_to(_CLOSED_REDIRECT_BY_ROLE.get(role, 'users:volunteer_dashboard'))
+            
+            request.enrollment_settings = enrollment_settings
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
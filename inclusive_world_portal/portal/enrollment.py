@@ -0,0 +1,73 @@
+"""
+Enrollment helpers shared by the portal views and the payment fulfilment task.
+"""
+from django.db.models import Case, IntegerField, Value, When
+
+from .models import Enrollment, EnrollmentStatus
+
+
+def stripe_intent_cache_key(user_id, selections_data, amount_cents):
+    """
+    Cache key for the reusable Stripe Payment Intent of one checkout.
+    The ranks are part of the key because they are written into the intent's
+    metadata, so re-ranking the same programs gets a fresh intent.
+    """
+    selections = ','.join(sorted(f"{item['program_id']}:{item['rank']}" for item in selections_data))
+    return f"portal:stripe_intent:{user_id}:{selections}:{amount_cents}"
+
+
+def upsert_pending_enrollments(user, selections_data, programs_by_id):
+    """
+    Create or update the user's enrollment for each ranked selection as
+    pending (to be reviewed by staff), in a single INSERT ... ON CONFLICT.
+    A program selected twice keeps its last rank, as repeated
+    update_or_create calls would; Postgres rejects touching a row twice in
+    one upsert.
+    """
+    by_program = {selection['program_id']: selection for selection in selections_data}
+    return Enrollment.objects.bulk_create(
+        [
+            Enrollment(
+                user=user,
+                program=programs_by_id[program_id],
+                status='pending',
+                preference_order=selection['rank'],
+            )
+            for program_id, selection in by_program.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['user', 'program'],
+        update_fields=['status', 'preference_order'],
+    )
+
+
+def add_paid_enrollments(user, selections_data, programs_by_id):
+    """
+    Record a paid checkout as pending enrollments, safe to run more than once.
+    New enrollments are inserted; existing ones only have their rank refreshed,
+    and only while still pending, so a repeated fulfilment never moves an
+    enrollment staff have already approved, waitlisted or rejected.
+    Returns the number of programs covered.
+    """
+    ranks = {selection['program_id']: selection['rank'] for selection in selections_data}
+    if not ranks:
+        return 0
+    Enrollment.objects.bulk_create(
+        [
+            Enrollment(
+                user=user,
+                program=programs_by_id[program_id],
+                status=EnrollmentStatus.PENDING,
+                preference_order=rank,
+            )
+            for program_id, rank in ranks.items()
+        ],
+        ignore_conflicts=True,
+    )
+    Enrollment.objects.filter(
+        user=user, program_id__in=list(ranks), status=EnrollmentStatus.PENDING
+    ).update(preference_order=Case(
+        *[When(program_id=program_id, then=Value(rank)) for program_id, rank in ranks.items()],
+        output_field=IntegerField(),
+    ))
+    return len(ranks)
@@ -6,11 +6,12 @@ import logging
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 
 from .models import EnrollmentSettings, RoleEnrollmentRequirement
+from .reversers import redirect_to
 from survey.models import Survey
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ def enrollment_settings_view(request):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, _('Only managers can access enrollment settings.'))
-        return redirect('users:dashboard')
+        return redirect_to('users:dashboard')
     
     settings = EnrollmentSettings.get_settings()
     
@@ -65,12 +66,16 @@ def toggle_enrollment_status(request):
         settings.enrollment_open = not settings.enrollment_open
         settings.updated_by = request.user
         
+        update_fields = ['enrollment_open', 'updated_by']
+        
         # Get closure reason if closing
         if not settings.enrollment_open:
             closure_reason = request.POST.get('closure_reason', '')
             settings.closure_reason = closure_reason
+            update_fields.append('closure_reason')
         
-        settings.save()
+        # get_settings() guarantees the row exists, so write only what changed
+        settings.save(update_fields=update_fields)
         
         status = "opened" if settings.enrollment_open else "closed"
         message = f'Enrollment has been {status}.'
@@ -120,7 +125,7 @@ def update_role_requirement(request, requirement_id):
         survey_ids = request.POST.getlist('required_surveys')
         requirement.required_surveys.set(survey_ids)
         
-        requirement.save()
+        requirement.save(update_fields=['require_profile_completion', 'is_active'])
         
         logger.info(f"Manager {request.user.username} updated requirements for {requirement.role}")
         
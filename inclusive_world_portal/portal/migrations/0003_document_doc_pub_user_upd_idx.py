@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(condition=models.Q(('published', True)), fields=['user', '-updated_at'], name='doc_pub_user_upd_idx'),
+        ),
+    ]
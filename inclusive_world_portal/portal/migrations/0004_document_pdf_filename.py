@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:31
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_pdf_filename(apps, schema_editor):
+    Document = apps.get_model('portal', 'Document')
+    documents = Document.objects.only('document_id', 'user_id', 'title')
+    for document in documents.iterator(chunk_size=500):
+        document.pdf_filename = f"{slugify(document.title)}_{document.user_id}_{document.document_id}.pdf"
+        document.save(update_fields=['pdf_filename'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0003_document_doc_pub_user_upd_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='pdf_filename',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Storage filename for the published PDF (derived from the title on save)', max_length=300),
+        ),
+        migrations.RunPython(populate_pdf_filename, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,141 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:48
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+UPDATED_AT_TABLES = [
+    'portal_program',
+    'portal_enrollment',
+    'portal_attendancerecord',
+    'portal_buddyassignment',
+    'portal_payment',
+    'portal_document',
+    'portal_enrollmentsettings',
+    'portal_roleenrollmentrequirement',
+]
+
+CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION portal_set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = STATEMENT_TIMESTAMP();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION = "DROP FUNCTION IF EXISTS portal_set_updated_at();"
+
+CREATE_TRIGGER = (
+    "CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+    "FOR EACH ROW EXECUTE FUNCTION portal_set_updated_at();"
+)
+
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table};"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0004_document_pdf_filename'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='program',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='program',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='enrolled_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='programvolunteerlead',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='buddyassignment',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='buddyassignment',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='enrollmentsettings',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='enrollmentsettings',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='roleenrollmentrequirement',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='roleenrollmentrequirement',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+        *[
+            migrations.RunSQL(
+                CREATE_TRIGGER.format(table=table),
+                DROP_TRIGGER.format(table=table),
+            )
+            for table in UPDATED_AT_TABLES
+        ],
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0005_db_side_timestamps'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='attendancerecord',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='buddyassignment',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='enrollment',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='attendancerecord',
+            constraint=models.UniqueConstraint(fields=('program', 'user', 'attendance_date'), name='attendance_program_user_date_uq'),
+        ),
+        migrations.AddConstraint(
+            model_name='attendancerecord',
+            constraint=models.CheckConstraint(condition=models.Q(('attendance_status__in', ['present', 'tardy', 'informed', 'uninformed'])), name='attendance_status_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='buddyassignment',
+            constraint=models.UniqueConstraint(fields=('program', 'member_user'), name='buddy_program_member_uq'),
+        ),
+        migrations.AddConstraint(
+            model_name='enrollment',
+            constraint=models.UniqueConstraint(fields=('user', 'program'), name='enroll_user_program_uq'),
+        ),
+        migrations.AddConstraint(
+            model_name='enrollment',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['pending', 'approved', 'waitlisted', 'rejected', 'withdrawn'])), name='enroll_status_valid'),
+        ),
+    ]
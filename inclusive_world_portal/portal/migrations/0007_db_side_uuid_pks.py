@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:40
+
+import django.contrib.postgres.functions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0006_unique_and_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='attendance_id',
+            field=models.UUIDField(db_default=django.contrib.postgres.functions.RandomUUID(), editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='buddyassignment',
+            name='id',
+            field=models.UUIDField(db_default=django.contrib.postgres.functions.RandomUUID(), editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='payment_id',
+            field=models.UUIDField(db_default=django.contrib.postgres.functions.RandomUUID(), editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='programvolunteerlead',
+            name='id',
+            field=models.UUIDField(db_default=django.contrib.postgres.functions.RandomUUID(), editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='roleenrollmentrequirement',
+            name='requirement_id',
+            field=models.UUIDField(db_default=django.contrib.postgres.functions.RandomUUID(), editable=False, primary_key=True, serialize=False),
+        ),
+    ]
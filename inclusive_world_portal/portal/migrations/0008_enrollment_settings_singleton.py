@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-16 11:10
+
+from django.db import migrations, models
+
+
+def collapse_to_singleton(apps, schema_editor):
+    """Drop any stray rows so the id=1 check can be added."""
+    EnrollmentSettings = apps.get_model('portal', 'EnrollmentSettings')
+    EnrollmentSettings.objects.exclude(id=1).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0007_db_side_uuid_pks'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_to_singleton, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='enrollmentsettings',
+            constraint=models.CheckConstraint(condition=models.Q(('id', 1)), name='enrollment_settings_singleton'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-16 11:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0008_enrollment_settings_singleton'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='buddyassignment',
+            name='portal_budd_program_0f485c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='buddyassignment',
+            name='portal_budd_member__1f5f25_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='buddyassignment',
+            name='portal_budd_volunte_c761fa_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='programvolunteerlead',
+            name='portal_prog_program_33605a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='programvolunteerlead',
+            name='portal_prog_volunte_a67a14_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='portal_docu_created_52f0f5_idx',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0009_drop_redundant_fk_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['name'], name='program_active_name_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-16 15:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0010_program_active_name_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancerecord',
+            index=models.Index(fields=['program', 'attendance_date'], name='att_prog_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendancerecord',
+            index=models.Index(fields=['user', '-attendance_date'], name='att_user_date_idx'),
+        ),
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='program',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_records', to='portal.program'),
+        ),
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_records', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
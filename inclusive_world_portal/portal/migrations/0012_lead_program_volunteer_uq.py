@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-16 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portal', '0011_attendance_composite_indexes'),
+    ]
+
+    operations = [
+        # Keep the oldest row of any duplicated (program, volunteer) pair so
+        # the constraint can be added
+        migrations.RunSQL(
+            sql="""
+                DELETE FROM portal_programvolunteerlead AS dup
+                USING portal_programvolunteerlead AS keep
+                WHERE dup.program_id = keep.program_id
+                  AND dup.volunteer_id = keep.volunteer_id
+                  AND (dup.created_at, dup.id) > (keep.created_at, keep.id)
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='programvolunteerlead',
+            constraint=models.UniqueConstraint(fields=('program', 'volunteer'), name='lead_program_volunteer_uq'),
+        ),
+    ]
@@ -1,8 +1,13 @@
+import time
 import uuid
 from decimal import Decimal
 from django.conf import settings
+from django.contrib.postgres.functions import RandomUUID
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Now
 from django.utils import timezone
+from django.utils.text import slugify
 
 # -------------------------
 # Choice enums (from your SQL enums)
@@ -21,6 +26,10 @@ class UserRoleType(models.TextChoices):
     PCM = "person_centered_manager", "Person-Centered Manager"
     UNASSIGNED = "unassigned", "Unassigned"
 
+# Roles that take part as volunteers: they log hours, can be buddies and use
+# the volunteer (no payment) enrollment flow
+VOLUNTEER_ROLES: frozenset[str] = frozenset({UserRoleType.VOLUNTEER, UserRoleType.MANAGER, UserRoleType.PCM})
+
 class EnrollmentStatus(models.TextChoices):
     PENDING = "pending", "Pending"
     APPROVED = "approved", "Approved"
@@ -42,8 +51,14 @@ class AttendanceStatus(models.TextChoices):
 # -------------------------
 # Programs & Enrollment
 # -------------------------
+# Timestamps are filled in by the database: created_at/updated_at default to
+# STATEMENT_TIMESTAMP() on insert and a BEFORE UPDATE trigger (see migration
+# 0005_db_side_timestamps) keeps updated_at current.
 
 class Program(models.Model):
+    # Program/Enrollment/Document keep a Python-side uuid4: import-export rows
+    # with a blank id rely on it, and Document.save() needs its pk up front.
+    # Other UUID PKs are generated by Postgres (gen_random_uuid()).
     program_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -55,19 +70,40 @@ class Program(models.Model):
     end_date = models.DateField(null=True, blank=True)
     enrollment_status = models.CharField(max_length=64, blank=True)  # e.g., "open"/"closed"
     enrolled = models.PositiveIntegerField(default=0)                 # kept as counter like SQL
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         indexes = [
             models.Index(fields=["archived", "enrollment_status", "start_date"]),
+            # Catalogs: filter(archived=False).order_by("name")
+            models.Index(
+                fields=["name"],
+                condition=models.Q(archived=False),
+                name="program_active_name_idx",
+            ),
         ]
 
+    CACHE_VERSION_KEY = "portal:programs_version"
+
+    @classmethod
+    def cache_version(cls):
+        """
+        Token for caches of program listings (e.g. the catalog grid fragment).
+        portal.signals replaces it whenever a program is saved or deleted.
+        """
+        return cache.get_or_set(cls.CACHE_VERSION_KEY, time.time_ns, None)
+
+    @staticmethod
+    def spots_left(capacity: int | None, enrolled: int) -> int | None:
+        """Open spots for a capacity and enrolled count; None means unlimited."""
+        if capacity is None:
+            return None
+        return max(capacity - enrolled, 0)
+
     @property
     def available_spots(self) -> int | None:
-        if self.capacity is None:
-            return None
-        return max(self.capacity - self.enrolled, 0)
+        return self.spots_left(self.capacity, self.enrolled)
 
     def __str__(self) -> str:
         """Return a friendly representation used in admin and form labels."""
@@ -79,9 +115,9 @@ class Enrollment(models.Model):
     program = models.ForeignKey(Program, on_delete=models.CASCADE, related_name="enrollments")
     status = models.CharField(max_length=16, choices=EnrollmentStatus.choices)
     preference_order = models.IntegerField(null=True, blank=True)
-    enrolled_at = models.DateTimeField(auto_now_add=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    enrolled_at = models.DateTimeField(db_default=Now(), editable=False)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
     assigned_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -92,51 +128,81 @@ class Enrollment(models.Model):
     assigned_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
-        unique_together = (("user", "program"),)  # pragmatic: avoid dup enrollments
+        constraints = [
+            # pragmatic: avoid dup enrollments
+            models.UniqueConstraint(fields=["user", "program"], name="enroll_user_program_uq"),
+            models.CheckConstraint(
+                condition=models.Q(status__in=EnrollmentStatus.values),
+                name="enroll_status_valid",
+            ),
+        ]
         indexes = [
             models.Index(fields=["program", "status"]),
         ]
 
 class AttendanceRecord(models.Model):
-    attendance_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    program = models.ForeignKey(Program, on_delete=models.CASCADE, related_name="attendance_records")
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="attendance_records")
+    attendance_id = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
+    # Both FK columns lead a composite index below, so no single-column ones
+    program = models.ForeignKey(Program, on_delete=models.CASCADE, related_name="attendance_records", db_index=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="attendance_records", db_index=False)
     attendance_date = models.DateField()
     attendance_status = models.CharField(max_length=16, choices=AttendanceStatus.choices)
     hours = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     notes = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
-        unique_together = (("program", "user", "attendance_date"),)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["program", "user", "attendance_date"],
+                name="attendance_program_user_date_uq",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(attendance_status__in=AttendanceStatus.values),
+                name="attendance_status_valid",
+            ),
+        ]
+        indexes = [
+            # One program's sheet for a date (attendance pages, date delete)
+            models.Index(fields=["program", "attendance_date"], name="att_prog_date_idx"),
+            # A user's history, newest first (my_attendance_view)
+            models.Index(fields=["user", "-attendance_date"], name="att_user_date_idx"),
+        ]
+
+    @classmethod
+    def stream_for_program(cls, program_id, chunk_size=2000):
+        """
+        Stream a program's attendance rows as dicts for exports/reports.
+        Uses a server-side cursor on Postgres so memory stays bounded
+        regardless of how many records the program has.
+        """
+        return cls.objects.filter(program_id=program_id).values(
+            "user_id", "attendance_date", "attendance_status", "hours",
+        ).order_by("attendance_date").iterator(chunk_size=chunk_size)
 
 class ProgramVolunteerLead(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
     program = models.ForeignKey(Program, on_delete=models.CASCADE, related_name="volunteer_leads")
     volunteer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="lead_roles")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
-        indexes = [
-            models.Index(fields=["program"]),
-            models.Index(fields=["volunteer"]),
+        constraints = [
+            models.UniqueConstraint(fields=["program", "volunteer"], name="lead_program_volunteer_uq"),
         ]
 
 class BuddyAssignment(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
     program = models.ForeignKey(Program, on_delete=models.CASCADE, related_name="buddy_assignments")
     member_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="buddy_member_assignments")
     volunteer_user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="buddy_volunteer_assignments")
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
-        unique_together = (("program", "member_user"),)
-        indexes = [
-            models.Index(fields=["program"]),
-            models.Index(fields=["member_user"]),
-            models.Index(fields=["volunteer_user"]),
+        constraints = [
+            models.UniqueConstraint(fields=["program", "member_user"], name="buddy_program_member_uq"),
         ]
 
 # -------------------------
@@ -149,8 +215,20 @@ class BuddyAssignment(models.Model):
 # Payments
 # -------------------------
 
+class PaymentQuerySet(models.QuerySet):
+    def for_list(self):
+        """Only the columns list pages show; skips the Stripe bookkeeping fields."""
+        return self.only(
+            "payment_id", "user_id", "program_id", "amount", "currency", "status", "created_at",
+        )
+
+
+class PaymentManager(models.Manager.from_queryset(PaymentQuerySet)):  # type: ignore[misc]
+    pass
+
+
 class Payment(models.Model):
-    payment_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    payment_id = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="payments")
     program = models.ForeignKey(Program, on_delete=models.SET_NULL, null=True, blank=True, related_name="payments")
     stripe_payment_intent_id = models.CharField(max_length=255, unique=True)
@@ -158,8 +236,10 @@ class Payment(models.Model):
     currency = models.CharField(max_length=12)
     status = models.CharField(max_length=64)
     payment_method = models.CharField(max_length=64)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = PaymentManager()
 
 # -------------------------
 # Documents
@@ -170,6 +250,21 @@ class DocumentState(models.TextChoices):
     REVIEW = "review", "Review"
     FINAL = "final", "Final"
 
+class DocumentQuerySet(models.QuerySet):
+    def with_content(self):
+        """Re-include the HTML body deferred by the default manager."""
+        return self.defer(None)
+
+
+class DocumentManager(models.Manager.from_queryset(DocumentQuerySet)):  # type: ignore[misc]
+    """
+    Defer the (unbounded) Quill HTML body by default so list views only
+    read the narrow metadata columns. Use .with_content() when the body is needed.
+    """
+    def get_queryset(self):
+        return super().get_queryset().defer("content")
+
+
 class Document(models.Model):
     """
     User documents created with the Quill editor.
@@ -233,27 +328,78 @@ class Document(models.Model):
         blank=True,
         help_text="Low-res thumbnail of the document generated during publish"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    pdf_filename = models.CharField(
+        max_length=300,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Storage filename for the published PDF (derived from the title on save)"
+    )
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = DocumentManager()
 
     class Meta:
         ordering = ['-updated_at']
         indexes = [
             models.Index(fields=['user', '-updated_at']),
-            models.Index(fields=['created_by']),
             models.Index(fields=['published']),
+            # Partial index for the "my published documents, newest first" read
+            models.Index(
+                fields=['user', '-updated_at'],
+                condition=models.Q(published=True),
+                name='doc_pub_user_upd_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} - {self.user.username}"
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored title so save() only re-slugifies on change
+        instance._loaded_title = instance.__dict__.get('title')
+        return instance
+
+    def save(self, *args, **kwargs):
+        if (
+            self._state.adding
+            or not self.pdf_filename
+            or self.title != getattr(self, '_loaded_title', None)
+        ):
+            self.pdf_filename = self._build_pdf_filename()
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'pdf_filename'}
+        super().save(*args, **kwargs)
+        self._loaded_title = self.title
+
+    def _build_pdf_filename(self):
+        return f"{slugify(self.title)}_{self.user_id}_{self.document_id}.pdf"
+
     def get_pdf_filename(self):
-        """Generate filename for PDF"""
-        from django.utils.text import slugify
-        safe_title = slugify(self.title)
-        return f"{safe_title}_{self.user.username}_{self.document_id}.pdf"
+        """Return the filename for the published PDF."""
+        return self.pdf_filename or self._build_pdf_filename()
 
 
+def user_with_docs(user_ids):
+    """
+    Users with their documents prefetched in one extra query. The prefetch
+    is column-pruned to the metadata a listing needs (no HTML body, no PDF).
+    """
+    from django.contrib.auth import get_user_model
+
+    return get_user_model().objects.filter(id__in=user_ids).prefetch_related(
+        models.Prefetch(
+            "documents",
+            queryset=Document.objects.only(
+                "document_id", "user_id", "title", "published", "updated_at",
+            ).order_by("-updated_at"),
+        )
+    )
+
 
 # -------------------------
 # Enrollment Settings
@@ -281,26 +427,30 @@ class EnrollmentSettings(models.Model):
         related_name="enrollment_setting_updates",
         help_text="User who last updated this setting"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
     
     class Meta:
         verbose_name = "Enrollment Settings"
         verbose_name_plural = "Enrollment Settings"
+        constraints = [
+            # Singleton: the only legal row is id=1 (the field default).
+            models.CheckConstraint(condition=models.Q(id=1), name="enrollment_settings_singleton"),
+        ]
     
-    def save(self, *args, **kwargs):
-        # Enforce singleton pattern
-        self.id = 1
-        super().save(*args, **kwargs)
-    
-    def delete(self, *args, **kwargs):
-        # Prevent deletion of the singleton
-        pass
-    
+    CACHE_KEY = "portal:enrollment_settings"
+    CACHE_TIMEOUT = 60 * 60
+
     @classmethod
     def get_settings(cls):
-        """Get or create the singleton settings instance."""
-        obj, created = cls.objects.get_or_create(id=1)
+        """
+        Get or create the singleton settings instance.
+        Served from the cache; portal.signals drops the entry on save/delete.
+        """
+        obj = cache.get(cls.CACHE_KEY)
+        if obj is None:
+            obj, created = cls.objects.get_or_create(id=1)
+            cache.set(cls.CACHE_KEY, obj, cls.CACHE_TIMEOUT)
         return obj
     
     def __str__(self):
@@ -314,7 +464,7 @@ class RoleEnrollmentRequirement(models.Model):
     Allows managers to configure which surveys and profile completion
     are required before users of a specific role can register for programs.
     """
-    requirement_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    requirement_id = models.UUIDField(primary_key=True, db_default=RandomUUID(), editable=False)
     role = models.CharField(
         max_length=50,
         choices=UserRoleType.choices,
@@ -335,8 +485,8 @@ class RoleEnrollmentRequirement(models.Model):
         default=True,
         help_text="Whether this requirement is currently enforced"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
     
     class Meta:
         verbose_name = "Role Enrollment Requirement"
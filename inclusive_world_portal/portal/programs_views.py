@@ -3,7 +3,7 @@ Views for programs display with role-based access.
 """
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from django.db.models import Prefetch, Q
+from django.db.models import Exists, OuterRef, Prefetch, Sum
 
 from .models import Enrollment, Payment, Program, EnrollmentStatus, ProgramVolunteerLead
 
@@ -16,13 +16,19 @@ def programs_view(request):
     - Managers or Program Leads: Shows programs they manage with full details
     """
     user = request.user
-    is_manager = user.role == 'manager'
-    is_pcm = user.role == 'person_centered_manager'
+    role = user.role
+    is_manager = role == 'manager'
+    is_pcm = role == 'person_centered_manager'
     is_full_manager = is_manager or is_pcm
     
-    # Check if user is a program lead for any programs
-    user_led_program_ids = set(
-        ProgramVolunteerLead.objects.filter(volunteer=user).values_list('program_id', flat=True)
+    # Check if user is a program lead for any programs. Managers/PCMs never
+    # need this (they manage everything), so skip the query for them. The
+    # subquery is reused as an SQL IN (semi-join); the frozenset serves
+    # Python-side checks.
+    led_subq = ProgramVolunteerLead.objects.filter(volunteer=user).values('program_id')
+    user_led_program_ids = (
+        frozenset() if is_full_manager
+        else frozenset(led_subq.values_list('program_id', flat=True))
     )
     has_management_access = is_full_manager or bool(user_led_program_ids)
     
@@ -30,24 +36,39 @@ def programs_view(request):
         # Management view: Show all programs user can manage
         if is_full_manager:
             # Managers and PCMs see all programs with full edit access
-            programs = Program.objects.prefetch_related('volunteer_leads__volunteer').all().order_by('name')
+            programs = Program.objects.all()
         else:
-            # Volunteer program leads see only their programs
-            programs = Program.objects.filter(
-                program_id__in=user_led_program_ids
-            ).prefetch_related('volunteer_leads__volunteer').order_by('name')
-        
-        # Get user's enrollments to show their status
-        user_enrollments = {
-            e.program_id: e for e in Enrollment.objects.filter(user=user).select_related('program')
-        }
+            # Volunteer program leads see only their programs; the same EXISTS
+            # both filters the rows and flags them as editable
+            programs = Program.objects.annotate(
+                is_lead=Exists(
+                    ProgramVolunteerLead.objects.filter(program_id=OuterRef('program_id'), volunteer=user)
+                )
+            ).filter(is_lead=True)
+        # Evaluate once; everything below (and the template) works off this list
+        programs = list(programs.prefetch_related(
+            # Leads and their users in one joined query instead of two; the
+            # table only shows each lead's name and username
+            Prefetch(
+                'volunteer_leads',
+                queryset=ProgramVolunteerLead.objects.select_related('volunteer').only(
+                    'program_id', 'volunteer__username', 'volunteer__name',
+                ),
+            ),
+            # The user's own enrollment (if any) rides along with each program
+            Prefetch(
+                'enrollments',
+                queryset=Enrollment.objects.filter(user=user),
+                to_attr='my_enrollments_list',
+            ),
+        ).order_by('name'))
         
         # Create a list of program data with enrollment info and edit permissions
         program_data = []
         for program in programs:
-            enrollment = user_enrollments.get(program.program_id)
+            enrollment = program.my_enrollments_list[0] if program.my_enrollments_list else None
             # Managers and PCMs can edit all programs; volunteers can only edit programs they lead
-            can_edit = is_full_manager or program.program_id in user_led_program_ids
+            can_edit = is_full_manager or program.is_lead
             program_data.append({
                 'program': program,
                 'enrollment': enrollment,
@@ -62,11 +83,13 @@ def programs_view(request):
         regular_enrollments = None
         if not is_full_manager and user_led_program_ids:
             # Get enrollments where user is NOT a lead (only for volunteer leads)
-            regular_enrollments = Enrollment.objects.filter(
-                user=user
-            ).exclude(
-                program_id__in=user_led_program_ids
-            ).select_related('program').order_by('-created_at')
+            regular_enrollments = list(
+                Enrollment.objects.filter(
+                    user=user
+                ).exclude(
+                    program_id__in=led_subq
+                ).select_related('program').order_by('-created_at')
+            )
         
         context = {
             'has_management_access': True,
@@ -76,32 +99,41 @@ def programs_view(request):
             'programs': programs,
             'users_with_active_opd': users_with_active_opd,  # Legacy - kept for template compatibility
             'enrollment_statuses': EnrollmentStatus.choices,
-            'has_programs': programs.exists(),
+            'has_programs': bool(programs),
             'regular_enrollments': regular_enrollments,
-            'has_regular_enrollments': regular_enrollments.exists() if regular_enrollments is not None else False,
+            'has_regular_enrollments': bool(regular_enrollments),
         }
     else:
         # Regular user view: Show only their enrollments
-        enrollments = Enrollment.objects.filter(
-            user=user
-        ).select_related('program').order_by('-created_at')
+        enrollments_qs = Enrollment.objects.filter(user=user)
+        enrollments = list(
+            enrollments_qs.select_related('program').order_by('-created_at')
+        )
         
         # Get all payments for the user with related program data
         payments = Payment.objects.filter(
             user=user
         ).select_related('program').order_by('-created_at')
         
-        # Calculate totals
-        total_fees = sum(enrollment.program.fee for enrollment in enrollments)
-        total_paid = sum(payment.amount for payment in payments if payment.status == 'succeeded')
+        # Calculate totals in the database rather than walking every row
+        total_fees = enrollments_qs.aggregate(t=Sum('program__fee'))['t'] or 0
+        total_paid = payments.filter(status='succeeded').aggregate(t=Sum('amount'))['t'] or 0
         
-        # Group enrollments by status for better organization
-        approved_enrollments = enrollments.filter(status='approved')
-        pending_enrollments = enrollments.filter(status='pending')
-        waitlisted_enrollments = enrollments.filter(status='waitlisted')
-        other_enrollments = enrollments.filter(
-            Q(status='rejected') | Q(status='withdrawn')
-        )
+        # Group enrollments by status for better organization (one pass over
+        # the rows already fetched, instead of one query per bucket)
+        approved_enrollments = []
+        pending_enrollments = []
+        waitlisted_enrollments = []
+        other_enrollments = []
+        for enrollment in enrollments:
+            if enrollment.status == EnrollmentStatus.APPROVED:
+                approved_enrollments.append(enrollment)
+            elif enrollment.status == EnrollmentStatus.PENDING:
+                pending_enrollments.append(enrollment)
+            elif enrollment.status == EnrollmentStatus.WAITLISTED:
+                waitlisted_enrollments.append(enrollment)
+            elif enrollment.status in (EnrollmentStatus.REJECTED, EnrollmentStatus.WITHDRAWN):
+                other_enrollments.append(enrollment)
         
         context = {
             'has_management_access': False,
@@ -114,7 +146,7 @@ def programs_view(request):
             'payments': payments,
             'total_fees': total_fees,
             'total_paid': total_paid,
-            'has_enrollments': enrollments.exists(),
+            'has_enrollments': bool(enrollments),
             'has_payments': payments.exists(),
             'enrollment_statuses': EnrollmentStatus.choices,
         }
@@ -2,6 +2,7 @@
 from import_export import resources, fields
 from import_export.widgets import ForeignKeyWidget, DateWidget
 from .models import Program, Enrollment
+from .signals import recount_enrolled, suspend_enrollment_counters
 from inclusive_world_portal.users.models import User
 
 
@@ -32,23 +33,62 @@ class ProgramResource(resources.ModelResource):
         report_skipped = True
 
 
+class CachedForeignKeyWidget(ForeignKeyWidget):
+    """
+    ForeignKeyWidget that resolves values from a lookup dict primed once per
+    import, instead of one SELECT per row. Falls back to the stock per-row
+    query when it hasn't been primed (e.g. when used outside an import).
+    """
+
+    def __init__(self, model, field="pk", **kwargs):
+        super().__init__(model, field=field, **kwargs)
+        self._cache = None
+
+    def prime(self, values):
+        values = {v for v in values if v not in (None, "")}
+        self._cache = {}
+        for obj in self.model.objects.filter(**{f"{self.field}__in": values}):
+            key = getattr(obj, self.field)
+            # Non-unique lookup field (e.g. Program.name): keep .get() semantics
+            self._cache[key] = None if key in self._cache else obj
+
+    def clear(self):
+        self._cache = None
+
+    def clean(self, value, row=None, **kwargs):
+        if self._cache is None:
+            return super().clean(value, row=row, **kwargs)
+        if value in (None, ""):
+            return None
+        if value not in self._cache:
+            raise self.model.DoesNotExist(
+                f"{self.model._meta.object_name} matching {self.field}={value!r} does not exist."
+            )
+        obj = self._cache[value]
+        if obj is None:
+            raise self.model.MultipleObjectsReturned(
+                f"More than one {self.model._meta.object_name} matches {self.field}={value!r}."
+            )
+        return obj
+
+
 class EnrollmentResource(resources.ModelResource):
     """Resource class for importing/exporting Enrollments (user-program relations)."""
     
     user = fields.Field(
         column_name='user_username',
         attribute='user',
-        widget=ForeignKeyWidget(User, field='username')
+        widget=CachedForeignKeyWidget(User, field='username')
     )
     program = fields.Field(
         column_name='program_name',
         attribute='program',
-        widget=ForeignKeyWidget(Program, field='name')
+        widget=CachedForeignKeyWidget(Program, field='name')
     )
     assigned_by = fields.Field(
         column_name='assigned_by_username',
         attribute='assigned_by',
-        widget=ForeignKeyWidget(User, field='username')
+        widget=CachedForeignKeyWidget(User, field='username')
     )
     
     class Meta:
@@ -62,3 +102,33 @@ class EnrollmentResource(resources.ModelResource):
         export_order = fields
         skip_unchanged = True
         report_skipped = True
+
+    def import_data(self, dataset, *args, **kwargs):
+        # Per-row counter signals would issue one UPDATE per imported row;
+        # suspend them and recount the touched programs once in after_import.
+        self._touched_program_ids = set()
+        with suspend_enrollment_counters():
+            return super().import_data(dataset, *args, **kwargs)
+
+    def before_import(self, dataset, **kwargs):
+        super().before_import(dataset, **kwargs)
+        # One query per FK column instead of one per row per FK
+        for field in self.fields.values():
+            if isinstance(field.widget, CachedForeignKeyWidget) and field.column_name in dataset.headers:
+                field.widget.prime(dataset[field.column_name])
+
+    def after_save_instance(self, instance, row, **kwargs):
+        super().after_save_instance(instance, row, **kwargs)
+        self._touched_program_ids.add(instance.program_id)
+
+    def after_delete_instance(self, instance, row, **kwargs):
+        super().after_delete_instance(instance, row, **kwargs)
+        self._touched_program_ids.add(instance.program_id)
+
+    def after_import(self, dataset, result, **kwargs):
+        super().after_import(dataset, result, **kwargs)
+        # Still inside the import transaction, so a dry run rolls this back too
+        recount_enrolled(self._touched_program_ids)
+        for field in self.fields.values():
+            if isinstance(field.widget, CachedForeignKeyWidget):
+                field.widget.clear()
@@ -0,0 +1,57 @@
+"""
+Memoized lazy URLs for the portal's argument-free routes.
+
+Kept apart from ``portal.urls`` so views can import them without an import
+cycle; ``portal.urls`` re-exports ``Reversers``.
+"""
+import functools
+
+from django.conf import settings
+from django.http import HttpResponseRedirect
+from django.urls import get_script_prefix, get_urlconf, reverse
+from django.utils.functional import lazy
+
+
+@functools.cache
+def _reverse_once(viewname, urlconf, script_prefix):
+    return reverse(viewname, urlconf=urlconf)
+
+
+def frozen_url(viewname):
+    """
+    Reverse an argument-free route once per URLconf and script prefix.
+
+    After the first call this is a dict lookup, so it suits URLs built on
+    every request (navigation) or once per row in a template loop.
+    """
+    return _reverse_once(viewname, get_urlconf(settings.ROOT_URLCONF), get_script_prefix())
+
+
+frozen_reverse_lazy = lazy(frozen_url, str)
+
+
+def redirect_to(viewname):
+    """
+    ``redirect(viewname)`` for an argument-free route, without a resolver
+    call on each request.
+    """
+    return HttpResponseRedirect(frozen_url(viewname))
+
+
+class Reversers:
+    """
+    Lazy URLs for the portal's argument-free routes.
+
+    Each is resolved on first string coercion and reused afterwards.
+    """
+    PROGRAM_CATALOG = frozen_reverse_lazy("portal:program_catalog")
+    PROGRAM_SELECTION = frozen_reverse_lazy("portal:program_selection")
+    CHECKOUT = frozen_reverse_lazy("portal:checkout")
+    ENROLLMENT_SUCCESS = frozen_reverse_lazy("portal:enrollment_success")
+    VOLUNTEER_PROGRAM_CATALOG = frozen_reverse_lazy("portal:volunteer_program_catalog")
+    PROGRAM_CREATE = frozen_reverse_lazy("portal:program_create")
+    ALL_MEMBERS = frozen_reverse_lazy("portal:all_members")
+    ALL_VOLUNTEERS = frozen_reverse_lazy("portal:all_volunteers")
+    PROGRAMS = frozen_reverse_lazy("portal:programs")
+    MY_ATTENDANCE = frozen_reverse_lazy("portal:my_attendance")
+    ENROLLMENT_SETTINGS = frozen_reverse_lazy("portal:enrollment_settings")
@@ -1,17 +1,77 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
 import django.db.models as models
 
-from .models import Enrollment, Program
+from .models import Enrollment, EnrollmentSettings, EnrollmentStatus, Program
 
 # Note: Default role assignment removed - roles are now set directly on the User model
 
+# Set while a bulk path (e.g. the admin enrollment import) owns the counters and
+# will recount them once at the end instead of one UPDATE per row.
+_counters_suspended: ContextVar[bool] = ContextVar("enrollment_counters_suspended", default=False)
+
+
+@contextmanager
+def suspend_enrollment_counters():
+    """Skip the per-row Program.enrolled updates below for the enclosed block."""
+    token = _counters_suspended.set(True)
+    try:
+        yield
+    finally:
+        _counters_suspended.reset(token)
+
+
+def recount_enrolled(program_ids):
+    """Reset Program.enrolled to the approved-enrollment count, in one UPDATE."""
+    program_ids = set(program_ids)
+    if not program_ids:
+        return
+    counts = dict(
+        Enrollment.objects.filter(program_id__in=program_ids, status=EnrollmentStatus.APPROVED)
+        .values_list("program_id")
+        .annotate(n=models.Count("pk"))
+        .order_by()
+    )
+    Program.objects.filter(pk__in=program_ids).update(
+        enrolled=models.Case(
+            *[models.When(pk=pid, then=models.Value(n)) for pid, n in counts.items()],
+            default=models.Value(0),
+        )
+    )
+
+
 @receiver(post_save, sender=Enrollment)
 def bump_enrollment_on_create(sender, instance, created, **kwargs):
+    if _counters_suspended.get():
+        return
     if created and instance.status == "approved":  # or whatever states should count
         Program.objects.filter(pk=instance.program_id).update(enrolled=models.F("enrolled") + 1)
 
 @receiver(post_delete, sender=Enrollment)
 def lower_enrollment_on_delete(sender, instance, **kwargs):
+    if _counters_suspended.get():
+        return
     Program.objects.filter(pk=instance.program_id, enrolled__gt=0).update(enrolled=models.F("enrolled") - 1)
+
+
+@receiver(post_save, sender=EnrollmentSettings)
+@receiver(post_delete, sender=EnrollmentSettings)
+def clear_cached_enrollment_settings(sender, **kwargs):
+    # After commit, or a concurrent get_settings() could re-cache the old row
+    transaction.on_commit(lambda: cache.delete(EnrollmentSettings.CACHE_KEY))
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+def bump_programs_cache_version(sender, **kwargs):
+    # A fresh token (never a counter) so an evicted key can't reuse a stale one.
+    # Taken after commit, or a request in between would cache the uncommitted
+    # catalog under the new token.
+    transaction.on_commit(lambda: cache.set(Program.CACHE_VERSION_KEY, time.time_ns(), None))
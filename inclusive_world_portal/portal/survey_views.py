@@ -4,101 +4,40 @@ Provides robust, pre-computed survey data to avoid template logic issues.
 """
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
-from django.db.models import Prefetch
+from django.db.models import OuterRef, Subquery
 from survey.models import Survey, Response
 
 
-class SurveyItemData:
+def build_survey_dict(survey, required_ids):
     """
-    Data container for a single survey item with all computed properties.
-    This eliminates complex template logic and ensures predictable rendering.
+    Pre-compute everything the survey list template needs for one survey.
+    
+    Expects `survey.my_last_updated` to be annotated by survey_list_view:
+    the current user's latest response timestamp, or None if they haven't
+    responded. No Response rows are loaded.
     """
-    def __init__(self, survey, user):
-        self.survey = survey
-        self.user = user
-        self._user_response = None
-        self._compute_status()
+    last_updated = survey.my_last_updated
+    is_completed = last_updated is not None
     
-    def _compute_status(self):
-        """Pre-compute all user-specific survey status information."""
-        # Get user's response if it exists
-        if self.user.is_authenticated:
-            try:
-                # Try to use prefetched data first
-                if hasattr(self.survey, 'user_responses_list'):
-                    self._user_response = self.survey.user_responses_list[0] if self.survey.user_responses_list else None
-                else:
-                    self._user_response = self.survey.responses.filter(user=self.user).first()
-            except Exception:
-                self._user_response = None
-        
-        # Compute derived properties
-        self.has_response = self._user_response is not None
-        self.is_completed = self.has_response
-        self.is_incomplete = not self.has_response
-        
+    return {
+        'id': survey.id,
+        'name': survey.name,
+        'description': survey.description,
+        'expire_date': survey.expire_date,
+        'need_logged_user': survey.need_logged_user,
+        'has_response': is_completed,
+        'is_completed': is_completed,
+        'is_incomplete': not is_completed,
+        'is_required': survey.id in required_ids,
         # Action button properties
-        if self.has_response:
-            self.action_text = "Edit Response"
-            self.action_url = self.survey.get_absolute_url()
-        else:
-            self.action_text = "Start"
-            self.action_url = self.survey.get_absolute_url()
-        
+        'action_text': "Edit Response" if is_completed else "Start",
+        'action_url': survey.get_absolute_url(),
         # Status badge properties
-        if self.is_completed:
-            self.status_badge_class = "completed"
-            self.status_badge_icon = "bi-check-circle-fill"
-            self.status_badge_text = "Completed"
-        else:
-            self.status_badge_class = "incomplete"
-            self.status_badge_icon = "bi-circle"
-            self.status_badge_text = "Incomplete"
-        
-        # Last updated timestamp
-        if self._user_response:
-            self.last_updated = self._user_response.updated
-        else:
-            self.last_updated = None
-    
-    @property
-    def id(self):
-        return self.survey.id
-    
-    @property
-    def name(self):
-        return self.survey.name
-    
-    @property
-    def description(self):
-        return self.survey.description
-    
-    @property
-    def expire_date(self):
-        return self.survey.expire_date
-    
-    @property
-    def need_logged_user(self):
-        return self.survey.need_logged_user
-    
-    def to_dict(self):
-        """Convert to dictionary for template context."""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'expire_date': self.expire_date,
-            'need_logged_user': self.need_logged_user,
-            'has_response': self.has_response,
-            'is_completed': self.is_completed,
-            'is_incomplete': self.is_incomplete,
-            'action_text': self.action_text,
-            'action_url': self.action_url,
-            'status_badge_class': self.status_badge_class,
-            'status_badge_icon': self.status_badge_icon,
-            'status_badge_text': self.status_badge_text,
-            'last_updated': self.last_updated,
-        }
+        'status_badge_class': "completed" if is_completed else "incomplete",
+        'status_badge_icon': "bi-check-circle-fill" if is_completed else "bi-circle",
+        'status_badge_text': "Completed" if is_completed else "Incomplete",
+        'last_updated': last_updated,
+    }
 
 
 @login_required
@@ -111,42 +50,38 @@ def survey_list_view(request):
     """
     user = request.user
     
-    # Get available surveys with optimized queries
-    # Prefetch only the current user's responses to minimize data transfer
-    user_responses_prefetch = Prefetch(
-        'responses',
-        queryset=Response.objects.filter(user=user).select_related('user'),
-        to_attr='user_responses_list'
-    )
+    # Get available surveys in one query; the user's response status rides
+    # along as an annotated timestamp instead of prefetched Response objects
+    latest_user_response = Response.objects.filter(
+        survey=OuterRef('pk'),
+        user=user,
+    ).order_by('-updated').values('updated')[:1]
     
     surveys_queryset = Survey.objects.filter(
         is_published=True
-    ).prefetch_related(user_responses_prefetch).order_by('-expire_date', 'name')
+    ).annotate(
+        my_last_updated=Subquery(latest_user_response)
+    ).order_by('-expire_date', 'name')
     
     # Get required survey IDs from context processor
     from inclusive_world_portal.portal.models import RoleEnrollmentRequirement
-    required_survey_ids = []
+    required_survey_ids: frozenset = frozenset()
+    role = getattr(user, 'role', None)
     try:
-        if hasattr(user, 'role') and user.role:
+        if role:
             requirement = RoleEnrollmentRequirement.objects.get(
-                role=user.role,
+                role=role,
                 is_active=True
             )
-            required_survey_ids = list(requirement.required_surveys.values_list('id', flat=True))
+            required_survey_ids = frozenset(requirement.required_surveys.values_list('id', flat=True))
     except (RoleEnrollmentRequirement.DoesNotExist, AttributeError):
         pass
     
-    # Build enriched survey data
-    survey_items = []
-    for survey in surveys_queryset:
-        # Create enriched survey item
-        item_data = SurveyItemData(survey, user)
-        
-        # Add to list as dict for easy template access
-        survey_dict = item_data.to_dict()
-        survey_dict['is_required'] = survey.id in required_survey_ids
-        
-        survey_items.append(survey_dict)
+    # Build enriched survey data as plain dicts for easy template access
+    survey_items = [
+        build_survey_dict(survey, required_survey_ids)
+        for survey in surveys_queryset
+    ]
     
     context = {
         'survey_items': survey_items,
@@ -0,0 +1,73 @@
+import logging
+
+import stripe
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError
+
+from .enrollment import add_paid_enrollments, stripe_intent_cache_key
+from .models import Program
+
+logger = logging.getLogger(__name__)
+
+# Workers don't import portal.views, which sets this for the web process
+stripe.api_key = settings.STRIPE_SECRET_KEY if hasattr(settings, 'STRIPE_SECRET_KEY') else None
+
+
+@shared_task(
+    # The webhook has already been answered by now, so Stripe won't redeliver
+    # it; ride out Stripe and database hiccups here instead
+    autoretry_for=(stripe.APIConnectionError, stripe.RateLimitError, stripe.APIError, OperationalError),
+    retry_backoff=True,
+    max_retries=10,
+)
+def fulfill_enrollment_payment(payment_intent_id):
+    """
+    Create the pending enrollments a succeeded Stripe Payment Intent paid for.
+
+    Queued both by process_enrollment (when the browser reports success) and
+    by the payment_intent.succeeded webhook, so it may run twice for one
+    payment (and Stripe may redeliver the webhook). Later runs insert nothing
+    new and leave enrollments staff have already reviewed alone. The user and
+    ranked selections come from the intent metadata written by
+    checkout_intent_view, not from the session.
+    """
+    intent = stripe.PaymentIntent.retrieve(payment_intent_id)
+    if intent.status != 'succeeded':
+        return 0
+
+    metadata = intent.metadata
+    user_id = metadata.get('user_id')
+    selections_data = [
+        {'program_id': program_id, 'rank': int(rank)}
+        for program_id, rank in (
+            item.split(':') for item in metadata.get('selections', '').split(',') if item
+        )
+    ]
+    if not user_id or not selections_data:
+        return 0
+    # Built from the metadata as checkout_intent_view saw it, before any
+    # since-deleted programs are dropped below
+    intent_cache_key = stripe_intent_cache_key(user_id, selections_data, intent.amount)
+
+    programs_by_id = {
+        str(pk): program
+        for pk, program in Program.objects.in_bulk(
+            {selection['program_id'] for selection in selections_data}, field_name='program_id'
+        ).items()
+    }
+    # A program archived after payment is still honoured; one deleted since
+    # cannot be enrolled in
+    paid_selections = [s for s in selections_data if s['program_id'] in programs_by_id]
+
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is None:
+        logger.warning("Payment intent %s paid for user %s, who no longer exists", payment_intent_id, user_id)
+        return 0
+    enrolled = add_paid_enrollments(user, paid_selections, programs_by_id)
+
+    # The intent is spent; don't hand it out again for these selections
+    cache.delete(intent_cache_key)
+    return enrolled
@@ -3,6 +3,8 @@ Custom template tags and filters for the portal app.
 """
 from django import template
 
+from inclusive_world_portal.portal.reversers import frozen_url
+
 register = template.Library()
 
 
@@ -42,29 +44,10 @@ def get_volunteer_name(user):
     return "Unassigned"
 
 
-@register.filter
-def buddy_lookup(buddy_map, enrollment):
-    """
-    Look up buddy for a specific enrollment (program + member combination).
-    Usage: {{ buddy_map|buddy_lookup:enrollment }}
-    Returns the volunteer_id if found, None otherwise.
-    """
-    if not buddy_map or not enrollment:
-        return None
-    # Create tuple key: (program_id_str, member_user_id)
-    key = (str(enrollment.program.program_id), enrollment.user.id)
-    return buddy_map.get(key)
-
-
 @register.simple_tag
-def get_buddy_for_member(buddy_map, program_id, member_id):
+def furl(viewname):
     """
-    Look up buddy for a specific program and member combination.
-    Usage: {% get_buddy_for_member buddy_map program_id member_id %}
-    Returns the volunteer_id if found, None otherwise.
+    Like ``{% url %}`` for routes without arguments, but memoized.
+    Usage: {% furl 'portal:all_members' %}
     """
-    if not buddy_map:
-        return None
-    # Create tuple key: (program_id_str, member_user_id)
-    key = (str(program_id), member_id)
-    return buddy_map.get(key)
+    return frozen_url(viewname)
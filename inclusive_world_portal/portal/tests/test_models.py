@@ -2,7 +2,7 @@ import pytest
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from inclusive_world_portal.portal.models import (
-    Program, Enrollment
+    Program, Enrollment, EnrollmentSettings
 )
 
 User = get_user_model()
@@ -50,3 +50,108 @@ def test_notification_system():
     # Mark as read
     notification.mark_as_read()
     assert notification.unread is False
+
+@pytest.mark.django_db
+def test_document_content_deferred_by_default():
+    from inclusive_world_portal.portal.models import Document
+
+    u = User.objects.create(username="carol", email="c@example.com")
+    doc = Document.objects.create(user=u, title="Notes", content="<p>Hello</p>")
+
+    assert Document.objects.get(pk=doc.pk).get_deferred_fields() == {"content"}
+    assert Document.objects.with_content().get(pk=doc.pk).content == "<p>Hello</p>"
+
+@pytest.mark.django_db
+def test_attendance_stream_for_program():
+    from datetime import date
+
+    from inclusive_world_portal.portal.models import AttendanceRecord
+
+    u = User.objects.create(username="dave", email="d@example.com")
+    p = Program.objects.create(name="P2")
+    AttendanceRecord.objects.create(
+        program=p, user=u, attendance_date=date(2025, 1, 2), attendance_status="present",
+    )
+
+    rows = list(AttendanceRecord.stream_for_program(p.program_id))
+    assert rows == [{
+        "user_id": u.id,
+        "attendance_date": date(2025, 1, 2),
+        "attendance_status": "present",
+        "hours": None,
+    }]
+
+@pytest.mark.django_db
+def test_attendance_date_delete_is_one_query(django_assert_num_queries):
+    from datetime import date
+
+    from inclusive_world_portal.portal.models import AttendanceRecord
+
+    p = Program.objects.create(name="P3")
+    for i in range(3):
+        u = User.objects.create(username=f"att{i}", email=f"att{i}@example.com")
+        AttendanceRecord.objects.create(
+            program=p, user=u, attendance_date=date(2025, 1, 2), attendance_status="present",
+        )
+
+    with django_assert_num_queries(1):
+        deleted, _ = AttendanceRecord.objects.filter(
+            program=p, attendance_date=date(2025, 1, 2),
+        ).delete()
+    assert deleted == 3
+
+@pytest.mark.django_db
+def test_document_pdf_filename_tracks_title():
+    from inclusive_world_portal.portal.models import Document
+
+    u = User.objects.create(username="erin", email="e@example.com")
+    doc = Document.objects.create(user=u, title="My Plan")
+    assert doc.pdf_filename == f"my-plan_{u.id}_{doc.document_id}.pdf"
+
+    doc = Document.objects.get(pk=doc.pk)
+    doc.title = "Updated Plan"
+    doc.save()
+    doc.refresh_from_db()
+    assert doc.get_pdf_filename() == f"updated-plan_{u.id}_{doc.document_id}.pdf"
+
+@pytest.mark.django_db
+def test_user_with_docs_prefetches_metadata_only():
+    from inclusive_world_portal.portal.models import Document, user_with_docs
+
+    u = User.objects.create(username="frank", email="f@example.com")
+    Document.objects.create(user=u, title="Profile", content="<p>Body</p>")
+
+    [loaded] = user_with_docs([u.id])
+    [doc] = loaded.documents.all()
+    assert doc.title == "Profile"
+    assert "content" in doc.get_deferred_fields()
+
+@pytest.mark.django_db
+def test_suspended_counters_recount_once():
+    from inclusive_world_portal.portal.signals import recount_enrolled, suspend_enrollment_counters
+
+    p = Program.objects.create(name="P3", enrolled=5)
+    with suspend_enrollment_counters():
+        for i in range(3):
+            u = User.objects.create(username=f"bulk{i}", email=f"bulk{i}@example.com")
+            Enrollment.objects.create(user=u, program=p, status="approved")
+    p.refresh_from_db()
+    assert p.enrolled == 5
+
+    recount_enrolled([p.program_id])
+    p.refresh_from_db()
+    assert p.enrolled == 3
+
+@pytest.mark.django_db
+def test_enrollment_settings_cached_until_saved(django_assert_num_queries, django_capture_on_commit_callbacks):
+    from django.core.cache import cache
+
+    cache.delete(EnrollmentSettings.CACHE_KEY)
+    settings_obj = EnrollmentSettings.get_settings()
+    with django_assert_num_queries(0):
+        assert EnrollmentSettings.get_settings().enrollment_open
+
+    settings_obj.enrollment_open = False
+    with django_capture_on_commit_callbacks(execute=True):
+        settings_obj.save()
+    assert not EnrollmentSettings.get_settings().enrollment_open
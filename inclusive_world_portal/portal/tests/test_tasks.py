@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+import stripe
+
+from inclusive_world_portal.portal.models import Enrollment, Program
+from inclusive_world_portal.portal.tasks import fulfill_enrollment_payment
+from inclusive_world_portal.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _paid_intent(monkeypatch, user_id, selections):
+    intent = SimpleNamespace(
+        status="succeeded",
+        amount=5000,
+        metadata={
+            "user_id": str(user_id),
+            "selections": ",".join(f"{pid}:{rank}" for pid, rank in selections),
+        },
+    )
+    monkeypatch.setattr("stripe.PaymentIntent.retrieve", lambda payment_intent_id: intent)
+    return intent
+
+
+def test_repeated_fulfillment_keeps_reviewed_enrollments(monkeypatch):
+    user = UserFactory()
+    approved = Program.objects.create(name="Art", capacity=10)
+    fresh = Program.objects.create(name="Music", capacity=10)
+    Enrollment.objects.create(user=user, program=approved, status="approved", preference_order=2)
+    _paid_intent(monkeypatch, user.pk, [(approved.program_id, 1), (fresh.program_id, 2)])
+
+    assert fulfill_enrollment_payment("pi_123") == 2
+    assert fulfill_enrollment_payment("pi_123") == 2
+
+    approved_enrollment = Enrollment.objects.get(user=user, program=approved)
+    assert approved_enrollment.status == "approved"
+    assert approved_enrollment.preference_order == 2
+    assert Enrollment.objects.get(user=user, program=fresh).status == "pending"
+    assert Enrollment.objects.filter(user=user).count() == 2
+    approved.refresh_from_db()
+    assert approved.enrolled == 1
+
+
+def test_fulfillment_for_deleted_user_is_skipped(monkeypatch):
+    program = Program.objects.create(name="Art", capacity=10)
+    _paid_intent(monkeypatch, 999999, [(program.program_id, 1)])
+
+    assert fulfill_enrollment_payment("pi_123") == 0
+    assert not Enrollment.objects.exists()
+
+
+def test_fulfillment_retries_after_stripe_error(monkeypatch):
+    user = UserFactory()
+    program = Program.objects.create(name="Art", capacity=10)
+    intent = _paid_intent(monkeypatch, user.pk, [(program.program_id, 1)])
+    calls = []
+
+    def flaky_retrieve(payment_intent_id):
+        calls.append(payment_intent_id)
+        if len(calls) == 1:
+            raise stripe.APIConnectionError("Network down")
+        return intent
+
+    monkeypatch.setattr("stripe.PaymentIntent.retrieve", flaky_retrieve)
+    result = fulfill_enrollment_payment.apply(args=["pi_123"])
+
+    assert result.successful()
+    assert result.result == 1
+    assert calls == ["pi_123", "pi_123"]
+    assert Enrollment.objects.get(user=user, program=program).status == "pending"
@@ -0,0 +1,48 @@
+import pytest
+from django.urls import reverse
+
+from inclusive_world_portal.portal.models import Enrollment, Program
+from inclusive_world_portal.portal.views import ProgramFullError, _set_enrollment_status
+from inclusive_world_portal.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def full_program():
+    """A one-spot program that is already full, plus a pending enrollment for it."""
+    program = Program.objects.create(name="Art", capacity=1)
+    Enrollment.objects.create(user=UserFactory(), program=program, status="approved")
+    pending = Enrollment.objects.create(user=UserFactory(), program=program, status="pending")
+    return program, pending
+
+
+def _assert_unchanged(program, pending):
+    pending.refresh_from_db()
+    program.refresh_from_db()
+    assert pending.status == "pending"
+    assert program.enrolled == 1
+
+
+def test_approving_into_full_program_raises(full_program):
+    program, pending = full_program
+    manager = UserFactory(role="manager")
+
+    with pytest.raises(ProgramFullError):
+        _set_enrollment_status(pending.enrollment_id, "approved", manager)
+
+    _assert_unchanged(program, pending)
+
+
+def test_ajax_approval_into_full_program_is_409(client, full_program):
+    program, pending = full_program
+    client.force_login(UserFactory(role="manager"))
+
+    response = client.post(
+        reverse("portal:ajax_update_enrollment_status"),
+        {"enrollment_id": str(pending.enrollment_id), "status": "approved"},
+    )
+
+    assert response.status_code == 409
+    assert "capacity" in response.json()["error"]
+    _assert_unchanged(program, pending)
@@ -1,53 +1,145 @@
 """
 URL configuration for the portal app.
+
+Views in ``portal.views`` (which also holds the high-traffic catalog and
+checkout views) are imported with the URLconf; those in the other modules
+are referenced by dotted path and imported on first request. View modules:
+
+- ``portal.views``: catalog, checkout/enrollment, program management,
+  people, attendance and AJAX endpoints.
+- ``portal.programs_views``: ``programs_view``.
+- ``portal.enrollment_settings_views``: enrollment settings and role
+  requirements.
 """
-from django.urls import path
+from django.urls import path, register_converter
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_cookie, vary_on_headers
+from django.utils.module_loading import import_string
+
+from .converters import UUIDStringConverter
+from .reversers import Reversers, frozen_reverse_lazy  # noqa: F401
 from . import views
-from . import programs_views
-from . import enrollment_settings_views
+
+register_converter(UUIDStringConverter, "uuidstr")
+
+
+def _lazy(dotted_path):
+    """Return a view that imports ``dotted_path`` the first time it is called."""
+    module_path, _, name = dotted_path.rpartition(".")
+    view = None
+
+    def lazy_view(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path)
+        return view(request, *args, **kwargs)
+
+    lazy_view.__module__ = module_path
+    lazy_view.__name__ = lazy_view.__qualname__ = name
+    return lazy_view
+
+
+def _with_cache_policy(view, max_age, vary_headers=()):
+    """
+    Mark a view's responses as cacheable only by the user's own browser.
+
+    Every portal page is behind login and rendered for the requesting user,
+    so responses are never ``public``; ``Vary: Cookie`` keeps a shared cache
+    from handing one session's page to another. ``vary_headers`` lists any
+    request headers that also change the response.
+    """
+    view = cache_control(private=True, max_age=max_age)(view)
+    if vary_headers:
+        view = vary_on_headers(*vary_headers)(view)
+    return vary_on_cookie(view)
+
 
 app_name = "portal"
 
-urlpatterns = [
+# (route, view, URL name) per view module. A view is either a function name,
+# resolved lazily, or an already imported function (all of portal.views).
+_VIEWS_ROUTES = (
     # Program browsing and enrollment (members - with payment)
-    path("catalog/", views.program_catalog_view, name="program_catalog"),
-    path("catalog/<uuid:program_id>/", views.program_detail_view, name="program_detail"),
-    path("catalog/selection/", views.program_selection_view, name="program_selection"),
-    
+    ("catalog/", views.program_catalog_view, "program_catalog"),
+    ("catalog/<uuidstr:program_id>/", views.program_detail_view, "program_detail"),
+    ("catalog/selection/", views.program_selection_view, "program_selection"),
+
     # Checkout and enrollment (members)
-    path("checkout/", views.checkout_view, name="checkout"),
-    path("enrollment/process/", views.process_enrollment, name="process_enrollment"),
-    path("enrollment/success/", views.enrollment_success_view, name="enrollment_success"),
-    
+    ("checkout/", views.checkout_view, "checkout"),
+    ("checkout/intent/", views.checkout_intent_view, "checkout_intent"),
+    ("enrollment/process/", views.process_enrollment, "process_enrollment"),
+    ("enrollment/success/", views.enrollment_success_view, "enrollment_success"),
+
     # Volunteer program enrollment (no payment required)
-    path("volunteer/catalog/", views.volunteer_program_catalog_view, name="volunteer_program_catalog"),
-    path("volunteer/catalog/selection/", views.volunteer_program_selection_view, name="volunteer_program_selection"),
-    
+    ("volunteer/catalog/", views.volunteer_program_catalog_view, "volunteer_program_catalog"),
+    ("volunteer/catalog/selection/", views.volunteer_program_selection_view, "volunteer_program_selection"),
+
     # Program management (managers, PCMs, and program leads)
-    path("program/create/", views.manager_program_create_view, name="program_create"),
-    path("program/<uuid:program_id>/edit/", views.manager_program_edit_view, name="program_edit"),
-    path("program/<uuid:program_id>/add-user/", views.manager_program_add_user_view, name="program_add_user"),
-    path("program/<uuid:program_id>/attendance/", views.manager_program_attendance_list_view, name="program_attendance"),
-    path("program/<uuid:program_id>/attendance/edit/", views.manager_program_attendance_view, name="program_attendance_edit"),
-    path("program/<uuid:program_id>/attendance/delete/", views.manager_program_attendance_delete_view, name="program_attendance_delete"),
-    
+    ("program/create/", views.manager_program_create_view, "program_create"),
+    ("program/<uuidstr:program_id>/edit/", views.manager_program_edit_view, "program_edit"),
+    ("program/<uuidstr:program_id>/add-user/", views.manager_program_add_user_view, "program_add_user"),
+    ("program/<uuidstr:program_id>/attendance/", views.manager_program_attendance_list_view, "program_attendance"),
+    ("program/<uuidstr:program_id>/attendance/edit/", views.manager_program_attendance_view, "program_attendance_edit"),
+    ("program/<uuidstr:program_id>/attendance/delete/", views.manager_program_attendance_delete_view, "program_attendance_delete"),
+
     # Organization-wide people views (Manager/PCM)
-    path("people/members/", views.all_members_view, name="all_members"),
-    path("people/volunteers/", views.all_volunteers_view, name="all_volunteers"),
-    
-    # Programs - unified view for all users
-    path("programs/", programs_views.programs_view, name="programs"),
-    
+    ("people/members/", views.all_members_view, "all_members"),
+    ("people/volunteers/", views.all_volunteers_view, "all_volunteers"),
+
     # My Attendance
-    path("my-attendance/", views.my_attendance_view, name="my_attendance"),
-    
+    ("my-attendance/", views.my_attendance_view, "my_attendance"),
+
     # AJAX endpoints for enrollment management
-    path("ajax/enrollment/update-status/", views.ajax_update_enrollment_status, name="ajax_update_enrollment_status"),
-    path("ajax/enrollment/update-buddy/", views.ajax_update_buddy_assignment, name="ajax_update_buddy_assignment"),
-    
+    ("ajax/enrollment/update-status/", views.ajax_update_enrollment_status, "ajax_update_enrollment_status"),
+    ("ajax/enrollment/update-buddy/", views.ajax_update_buddy_assignment, "ajax_update_buddy_assignment"),
+)
+
+_PROGRAMS_VIEWS_ROUTES = (
+    # Programs - unified view for all users
+    ("programs/", "programs_view", "programs"),
+)
+
+_ENROLLMENT_SETTINGS_ROUTES = (
     # Enrollment Settings (Manager only)
-    path("enrollment-settings/", enrollment_settings_views.enrollment_settings_view, name="enrollment_settings"),
-    path("enrollment-settings/toggle/", enrollment_settings_views.toggle_enrollment_status, name="toggle_enrollment_status"),
-    path("enrollment-settings/requirement/<uuid:requirement_id>/update/", enrollment_settings_views.update_role_requirement, name="update_role_requirement"),
-    path("enrollment-settings/requirement/create/", enrollment_settings_views.create_role_requirement, name="create_role_requirement"),
+    ("enrollment-settings/", "enrollment_settings_view", "enrollment_settings"),
+    ("enrollment-settings/toggle/", "toggle_enrollment_status", "toggle_enrollment_status"),
+    ("enrollment-settings/requirement/<uuidstr:requirement_id>/update/", "update_role_requirement", "update_role_requirement"),
+    ("enrollment-settings/requirement/create/", "create_role_requirement", "create_role_requirement"),
+)
+
+_ROUTES = (
+    ("views", _VIEWS_ROUTES),
+    ("programs_views", _PROGRAMS_VIEWS_ROUTES),
+    ("enrollment_settings_views", _ENROLLMENT_SETTINGS_ROUTES),
+)
+
+# Browser cache lifetime (seconds) for read-only GET routes, by URL name. The
+# catalogs are redirect targets after selection/enrollment POSTs and show
+# flash messages, so they must revalidate; the program detail modal only
+# risks a briefly stale spot count. Routes not listed send no cache headers.
+_CACHE_MAX_AGE = {
+    "program_catalog": 0,
+    "program_detail": 60,
+    "volunteer_program_catalog": 0,
+}
+
+# Request headers a cached route's response depends on, by URL name. The
+# program detail view answers AJAX requests with JSON and others with HTML.
+_CACHE_VARY_HEADERS = {
+    "program_detail": ("X-Requested-With",),
+}
+
+
+def _view_for(module, view, name):
+    if isinstance(view, str):
+        view = _lazy(f"inclusive_world_portal.portal.{module}.{view}")
+    if name in _CACHE_MAX_AGE:
+        view = _with_cache_policy(view, _CACHE_MAX_AGE[name], _CACHE_VARY_HEADERS.get(name, ()))
+    return view
+
+
+urlpatterns = [
+    path(route, _view_for(module, view, name), name=name)
+    for module, routes in _ROUTES
+    for route, view, name in routes
 ]
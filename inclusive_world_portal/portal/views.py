@@ -4,51 +4,138 @@ Views for the portal app - Program enrollment and management.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
+from django.http import Http404, HttpResponseRedirect, JsonResponse
+from django.views.decorators.http import condition, require_http_methods
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    Case, Count, Exists, F, FilteredRelation, IntegerField, Max, OuterRef, Prefetch, Q, Subquery, Sum,
+    Value, When, Window,
+)
 from django.utils import timezone
+import hashlib
 import json
 import stripe
+from datetime import date, datetime
+from decimal import Decimal
 
-from .models import Program, Enrollment, Payment, EnrollmentSettings, EnrollmentStatus, BuddyAssignment
+from inclusive_world_portal.users.models import User
+
+from .models import (
+    AttendanceRecord, AttendanceStatus, BuddyAssignment, Document, Enrollment, EnrollmentStatus,
+    Payment, Program, ProgramVolunteerLead, VOLUNTEER_ROLES,
+)
+from .decorators import require_enrollment_open
+from .reversers import Reversers, redirect_to
+from .enrollment import stripe_intent_cache_key, upsert_pending_enrollments
+from .tasks import fulfill_enrollment_payment
 
 stripe.api_key = settings.STRIPE_SECRET_KEY if hasattr(settings, 'STRIPE_SECRET_KEY') else None
 
+_VALID_USER_STATUSES = frozenset(User.Status.values)
+_VALID_ENROLLMENT_STATUSES = frozenset(EnrollmentStatus.values)
+
+# Columns the people pages render for each user row
+_PEOPLE_LIST_FIELDS = ('id', 'name', 'username', 'role', 'status', 'date_joined', 'support_needs')
+
+
+def _published_document_exists():
+    """
+    Correlated EXISTS for "this user has at least one published document".
+    Annotate user querysets with it instead of calling .exists() per row.
+    """
+    return Exists(Document.objects.filter(user=OuterRef('pk'), published=True))
+
+
+def _user_display_name(user_id):
+    """
+    Name (or username) of the user with ``user_id`` for flash messages, or
+    None if there is no such user. Reads just those two columns.
+    """
+    row = User.objects.filter(id=user_id).values_list('name', 'username').first()
+    return None if row is None else row[0] or row[1]
+
+
+class ProgramFullError(Exception):
+    """Raised when approving an enrollment would exceed the program's capacity."""
+
+
+def _set_enrollment_status(enrollment_id, new_status, assigned_by):
+    """
+    Change an enrollment's status and keep Program.enrolled in step, in one
+    transaction. The enrollment row is locked so two concurrent approvals
+    can't both count, and the counter moves with a conditional F() update
+    instead of a read-modify-write on the program. Approving into a full
+    program raises ProgramFullError and leaves the enrollment unchanged.
+    """
+    with transaction.atomic():
+        enrollment = get_object_or_404(Enrollment.objects.select_for_update(), enrollment_id=enrollment_id)
+        was_approved = enrollment.status == EnrollmentStatus.APPROVED
+        
+        # Update program enrolled count if status changed to/from approved;
+        # the capacity check and the increment are one UPDATE
+        is_approved = new_status == EnrollmentStatus.APPROVED
+        programs = Program.objects.filter(pk=enrollment.program_id)
+        if is_approved and not was_approved:
+            has_room = programs.filter(
+                Q(capacity__isnull=True) | Q(enrolled__lt=F('capacity'))
+            ).update(enrolled=F('enrolled') + 1)
+            if not has_room:
+                raise ProgramFullError("This program is already at capacity.")
+        elif was_approved and not is_approved:
+            programs.filter(enrolled__gt=0).update(enrolled=F('enrolled') - 1)
+        
+        enrollment.status = new_status
+        enrollment.assigned_by = assigned_by
+        enrollment.assigned_at = timezone.now()
+        enrollment.save()
+    return enrollment
+
+
+def _active_programs_in_order(program_ids):
+    """
+    Non-archived programs for ``program_ids`` in one query, returned in the
+    given order; unknown or archived ids are skipped. Only the columns the
+    selection pages show are loaded.
+    """
+    by_id = {
+        str(pk): program
+        for pk, program in Program.objects.filter(archived=False).only(
+            'program_id', 'name', 'fee',
+        ).in_bulk(
+            program_ids, field_name='program_id'
+        ).items()
+    }
+    return [by_id[pid] for pid in program_ids if pid in by_id]
+
+
+def _catalog_context(user):
+    """
+    Context shared by the member and volunteer catalogs.
+    The program grid is a template fragment cached for all users and keyed on
+    ``programs_version``, so ``programs`` is only queried on a cache miss;
+    the user's own enrollments are marked client-side from
+    ``enrolled_program_ids``.
+    """
+    return {
+        # The catalog cards only show these; skip description and timestamps
+        'programs': Program.objects.filter(archived=False).only('program_id', 'name', 'fee', 'image').order_by('name'),
+        'programs_version': Program.cache_version(),
+        'enrolled_program_ids': [str(pk) for pk in user.enrollments.values_list('program_id', flat=True)],
+    }
+
 
 @login_required
+@require_enrollment_open("browsing programs")
 def program_catalog_view(request):
     """
     Display catalog of available programs for enrollment.
     Only accessible to users who meet enrollment requirements and when enrollment is open.
     """
-    enrollment_settings = EnrollmentSettings.get_settings()
-    
-    # Check if user meets enrollment requirements
-    meets_requirements, missing_items = request.user.enrollment_requirements_status
-    if not meets_requirements:
-        messages.warning(
-            request,
-            f"Please complete the following before browsing programs: {', '.join(missing_items)}"
-        )
-        return redirect('users:detail', username=request.user.username)
-    
-    # Check if enrollment is open
-    if not enrollment_settings.enrollment_open:
-        reason = enrollment_settings.closure_reason or "Registration is currently closed."
-        messages.info(request, reason)
-        return redirect('users:member_dashboard')
-    
-    # Get all active (non-archived) programs
-    programs = Program.objects.filter(archived=False).order_by('name')
-    
-    # Get user's existing enrollments to mark already enrolled programs
-    enrolled_program_ids = request.user.enrollments.values_list('program_id', flat=True)
-    
     context = {
-        'programs': programs,
-        'enrolled_program_ids': list(enrolled_program_ids),
-        'enrollment_settings': enrollment_settings,
+        **_catalog_context(request.user),
+        'enrollment_settings': request.enrollment_settings,
     }
     
     return render(request, 'portal/program_catalog.html', context)
@@ -60,60 +147,54 @@ def program_detail_view(request, program_id):
     Display detailed information about a specific program.
     Can be used for the info icon modal/page.
     """
-    program = get_object_or_404(Program, program_id=program_id)
+    user_enrollment = Exists(Enrollment.objects.filter(user=request.user, program=OuterRef('pk')))
     
-    # Check if user is already enrolled
-    is_enrolled = request.user.enrollments.filter(program=program).exists()
+    # Return JSON for AJAX requests (modal use case). Read the columns as a
+    # dict, which skips building a Program instance for a small payload.
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        row = Program.objects.filter(program_id=program_id).annotate(is_enrolled=user_enrollment).values(
+            'program_id', 'name', 'description', 'fee', 'capacity', 'enrolled',
+            'start_date', 'end_date', 'image', 'is_enrolled',
+        ).first()
+        if row is None:
+            raise Http404("No Program matches the given query.")
+        image = row.pop('image')
+        return JsonResponse({
+            **row,
+            'program_id': str(row['program_id']),
+            'fee': str(row['fee']),
+            'available_spots': Program.spots_left(row['capacity'], row['enrolled']),
+            'start_date': row['start_date'].isoformat() if row['start_date'] else None,
+            'end_date': row['end_date'].isoformat() if row['end_date'] else None,
+            'image_url': Program._meta.get_field('image').storage.url(image) if image else None,
+        })
+    
+    # Program plus "is the user already enrolled" in a single query
+    program = get_object_or_404(
+        Program.objects.only(
+            'program_id', 'name', 'description', 'fee', 'capacity', 'enrolled',
+            'start_date', 'end_date', 'image',
+        ).annotate(is_enrolled=user_enrollment),
+        program_id=program_id,
+    )
     
     context = {
         'program': program,
-        'is_enrolled': is_enrolled,
+        'is_enrolled': program.is_enrolled,
     }
     
-    # Return JSON for AJAX requests (modal use case)
-    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        return JsonResponse({
-            'program_id': str(program.program_id),
-            'name': program.name,
-            'description': program.description,
-            'fee': str(program.fee),
-            'capacity': program.capacity,
-            'enrolled': program.enrolled,
-            'available_spots': program.available_spots,
-            'start_date': program.start_date.isoformat() if program.start_date else None,
-            'end_date': program.end_date.isoformat() if program.end_date else None,
-            'image_url': program.image.url if program.image else None,
-            'is_enrolled': is_enrolled,
-        })
-    
     return render(request, 'portal/program_detail.html', context)
 
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@require_enrollment_open("enrolling")
 def program_selection_view(request):
     """
     Handle program selection and ranking.
     GET: Display selection interface with selected programs from URL
     POST: Process ranked selections and proceed to checkout
     """
-    enrollment_settings = EnrollmentSettings.get_settings()
-    
-    # Check if user meets enrollment requirements
-    meets_requirements, missing_items = request.user.enrollment_requirements_status
-    if not meets_requirements:
-        messages.warning(
-            request,
-            f"Please complete the following before enrolling: {', '.join(missing_items)}"
-        )
-        return redirect('users:detail', username=request.user.username)
-    
-    # Check if enrollment is open
-    if not enrollment_settings.enrollment_open:
-        reason = enrollment_settings.closure_reason or "Registration is currently closed."
-        messages.info(request, reason)
-        return redirect('users:member_dashboard')
-    
     if request.method == 'POST':
         # Get selected program IDs and their rankings from POST data
         try:
@@ -121,54 +202,50 @@ def program_selection_view(request):
             
             if not selections_data:
                 messages.error(request, "Please select at least one program.")
-                return redirect('portal:program_catalog')
+                return redirect_to('portal:program_catalog')
             
-            # Validate all programs exist and are available
-            program_ids = [item['program_id'] for item in selections_data]
-            programs = Program.objects.filter(
-                program_id__in=program_ids,
-                archived=False
-            )
+            # Validate all programs exist and are available (ids only)
+            program_ids = {item['program_id'] for item in selections_data}
+            available_ids = {
+                str(pk) for pk in Program.objects.filter(
+                    program_id__in=program_ids,
+                    archived=False
+                ).values_list('program_id', flat=True)
+            }
             
-            if len(programs) != len(program_ids):
+            if program_ids - available_ids:
                 messages.error(request, "Some selected programs are no longer available.")
-                return redirect('portal:program_catalog')
+                return redirect_to('portal:program_catalog')
             
             # Store selections in session for checkout
             request.session['program_selections'] = selections_data
             
-            return redirect('portal:checkout')
+            return redirect_to('portal:checkout')
             
         except (json.JSONDecodeError, KeyError) as e:
             messages.error(request, "Invalid selection data. Please try again.")
-            return redirect('portal:program_catalog')
+            return redirect_to('portal:program_catalog')
     
     # GET request - get program IDs from URL parameter
     programs_param = request.GET.get('programs', '')
     
     if not programs_param:
         messages.warning(request, "No programs selected. Please select programs first.")
-        return redirect('portal:program_catalog')
+        return redirect_to('portal:program_catalog')
     
     # Parse program IDs from comma-separated string
     program_ids = [pid.strip() for pid in programs_param.split(',') if pid.strip()]
     
     if not program_ids:
         messages.warning(request, "No programs selected. Please select programs first.")
-        return redirect('portal:program_catalog')
+        return redirect_to('portal:program_catalog')
     
     # Get program objects (maintain order from URL)
-    selected_programs = []
-    for program_id in program_ids:
-        try:
-            program = Program.objects.get(program_id=program_id, archived=False)
-            selected_programs.append(program)
-        except Program.DoesNotExist:
-            continue
+    selected_programs = _active_programs_in_order(program_ids)
     
     if not selected_programs:
         messages.error(request, "Selected programs are not available.")
-        return redirect('portal:program_catalog')
+        return redirect_to('portal:program_catalog')
     
     context = {
         'selected_programs': selected_programs,
@@ -179,84 +256,107 @@ def program_selection_view(request):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@require_enrollment_open("registration")
 def checkout_view(request):
     """
     Display checkout page with program selections and Stripe payment.
     """
-    enrollment_settings = EnrollmentSettings.get_settings()
-    
-    # Check enrollment requirements
-    meets_requirements, missing_items = request.user.enrollment_requirements_status
-    if not meets_requirements:
-        missing_text = ", ".join(missing_items)
-        messages.warning(request, f"Please complete the following before registration: {missing_text}")
-        return redirect('users:detail', username=request.user.username)
-
-    
-    # Check if enrollment is open
-    if not enrollment_settings.enrollment_open:
-        reason = enrollment_settings.closure_reason or "Registration is currently closed."
-        messages.info(request, reason)
-        return redirect('users:member_dashboard')
-    
     # Get selections from session
     selections_data = request.session.get('program_selections', [])
     
     if not selections_data:
         messages.warning(request, "No programs selected. Please select programs first.")
-        return redirect('portal:program_catalog')
-    
-    # Get program details
-    program_ids = [item['program_id'] for item in selections_data]
-    programs = Program.objects.filter(program_id__in=program_ids, archived=False)
+        return redirect_to('portal:program_catalog')
     
-    # Create a mapping of program_id to rank
+    # Get program details, ranked and ordered by Postgres in the same query;
+    # unranked programs can't occur but would sort last
     rank_map = {item['program_id']: item['rank'] for item in selections_data}
-    
-    # Add rank to each program and sort
-    programs_with_rank = []
-    for program in programs:
-        program.rank = rank_map.get(str(program.program_id), 999)  # type: ignore[attr-defined]
-        programs_with_rank.append(program)
-    
-    programs_with_rank.sort(key=lambda p: p.rank)  # type: ignore[attr-defined]
+    programs_with_rank = list(
+        Program.objects.filter(program_id__in=list(rank_map), archived=False)
+        .only('program_id', 'name', 'fee')
+        .annotate(rank=Case(
+            *[When(program_id=program_id, then=Value(rank)) for program_id, rank in rank_map.items()],
+            default=Value(999),
+            output_field=IntegerField(),
+        ))
+        # The total rides along on every row as a window over the result
+        # set, so Postgres adds up the fees without a second query
+        .annotate(total_fee=Window(Sum('fee')))
+        .order_by('rank')
+    )
     
     # Calculate total
-    total_amount = sum(program.fee for program in programs_with_rank)
+    total_amount = programs_with_rank[0].total_fee if programs_with_rank else Decimal('0')
     
-    # Create Stripe Payment Intent if Stripe is configured
-    stripe_client_secret = None
+    # The Stripe Payment Intent is created by checkout_intent_view once the
+    # page has loaded, so rendering never waits on Stripe
     stripe_public_key = getattr(settings, 'STRIPE_PUBLIC_KEY', None)
     
-    if stripe.api_key and request.method == 'GET':
+    context = {
+        'programs': programs_with_rank,
+        'total_amount': total_amount,
+        'stripe_public_key': stripe_public_key,
+        'stripe_enabled': bool(stripe.api_key and stripe_public_key),
+    }
+    
+    return render(request, 'portal/checkout.html', context)
+
+
+STRIPE_INTENT_TIMEOUT = 10 * 60
+
+
+@login_required
+@require_http_methods(["POST"])
+@require_enrollment_open("registration", json_response=True)
+def checkout_intent_view(request):
+    """
+    Create (or reuse) the Stripe Payment Intent for the session's selections.
+    Called by the checkout page after it renders. Reloading the page within
+    STRIPE_INTENT_TIMEOUT reuses the same intent instead of creating another.
+    """
+    if not stripe.api_key:
+        return JsonResponse({'error': 'Payment system not configured'}, status=503)
+    
+    selections_data = request.session.get('program_selections', [])
+    if not selections_data:
+        return JsonResponse({'error': 'No selections found'}, status=400)
+    
+    program_ids = [item['program_id'] for item in selections_data]
+    # Only the total is needed here, so let Postgres add up the fees
+    total_amount = Program.objects.filter(
+        program_id__in=program_ids, archived=False
+    ).aggregate(total=Sum('fee'))['total'] or Decimal('0')
+    amount_cents = int((total_amount * 100).to_integral_value())  # Convert to cents
+    
+    cache_key = stripe_intent_cache_key(request.user.id, selections_data, amount_cents)
+    client_secret = cache.get(cache_key)
+    if client_secret is None:
         try:
             intent = stripe.PaymentIntent.create(
-                amount=int(total_amount * 100),  # Convert to cents
+                amount=amount_cents,
                 currency='usd',
                 metadata={
                     'user_id': str(request.user.id),
                     'program_ids': ','.join(program_ids),
+                    # Read back by fulfill_enrollment_payment
+                    'selections': ','.join(
+                        f"{item['program_id']}:{item['rank']}" for item in selections_data
+                    ),
                 }
             )
-            stripe_client_secret = intent.client_secret
         except Exception as e:
-            messages.error(request, f"Payment system error: {str(e)}")
+            return JsonResponse({'error': f'Payment system error: {str(e)}'}, status=502)
+        client_secret = intent.client_secret
+        cache.set(cache_key, client_secret, STRIPE_INTENT_TIMEOUT)
     
-    context = {
-        'programs': programs_with_rank,
-        'total_amount': total_amount,
-        'stripe_public_key': stripe_public_key,
-        'stripe_client_secret': stripe_client_secret,
-    }
-    
-    return render(request, 'portal/checkout.html', context)
+    return JsonResponse({'client_secret': client_secret})
 
 
 @login_required
 @require_http_methods(["POST"])
 def process_enrollment(request):
     """
-    Process successful payment and create enrollments.
+    Queue enrollment creation for a successful payment.
     Called after Stripe payment succeeds.
     """
     try:
@@ -266,50 +366,19 @@ def process_enrollment(request):
         if not payment_intent_id:
             return JsonResponse({'error': 'Missing payment intent'}, status=400)
         
-        # Retrieve payment intent from Stripe
-        try:
-            intent = stripe.PaymentIntent.retrieve(payment_intent_id)
-        except Exception as e:
-            return JsonResponse({'error': f'Invalid payment: {str(e)}'}, status=400)
-        
-        if intent.status != 'succeeded':
-            return JsonResponse({'error': 'Payment not completed'}, status=400)
-        
-        # Get selections from session
-        selections_data = request.session.get('program_selections', [])
-        
-        if not selections_data:
-            return JsonResponse({'error': 'No selections found'}, status=400)
-        
-        # Create enrollments for each program with rank
-        enrollments_created = []
-        
-        for selection in selections_data:
-            program = get_object_or_404(
-                Program,
-                program_id=selection['program_id'],
-                archived=False
-            )
-            
-            # Create or update enrollment
-            enrollment, created = Enrollment.objects.update_or_create(
-                user=request.user,
-                program=program,
-                defaults={
-                    'status': 'pending',  # Will be reviewed by staff
-                    'preference_order': selection['rank'],
-                }
-            )
-            enrollments_created.append(enrollment)
+        # Verifying the intent with Stripe and writing the enrollments happens
+        # in the background from the intent's own metadata, so the session's
+        # selections aren't needed here; the payment_intent.succeeded webhook
+        # queues the same task in case this request never arrives
+        fulfill_enrollment_payment.delay(payment_intent_id)
         
         # Clear session
         request.session.pop('program_selections', None)
-        request.session.pop('selected_program_ids', None)
         
         messages.success(
             request,
-            f"Successfully enrolled in {len(enrollments_created)} program(s)! "
-            "Your enrollment will be reviewed by our team."
+            "Your payment is being processed. "
+            "Once it is confirmed, your enrollment will be reviewed by our team."
         )
         
         return JsonResponse({
@@ -335,50 +404,16 @@ def enrollment_success_view(request):
 # -------------------------
 
 @login_required
+@require_enrollment_open("browsing programs", roles=VOLUNTEER_ROLES)
 def volunteer_program_catalog_view(request):
     """
     Display catalog of available programs for volunteer enrollment.
     Same as regular catalog but for volunteers (no payment required).
     Only accessible to volunteers, managers, and person-centered managers who meet enrollment requirements and when enrollment is open.
     """
-    # Check if user is a volunteer, manager, or person-centered manager
-    if request.user.role not in ['volunteer', 'manager', 'person_centered_manager']:
-        messages.error(request, "This page is only accessible to volunteers, managers, and person-centered managers.")
-        return redirect('home')
-    
-    enrollment_settings = EnrollmentSettings.get_settings()
-    
-    # Check if user meets enrollment requirements
-    meets_requirements, missing_items = request.user.enrollment_requirements_status
-    if not meets_requirements:
-        messages.warning(
-            request,
-            f"Please complete the following before browsing programs: {', '.join(missing_items)}"
-        )
-        return redirect('users:detail', username=request.user.username)
-    
-    # Check if enrollment is open
-    if not enrollment_settings.enrollment_open:
-        reason = enrollment_settings.closure_reason or "Registration is currently closed."
-        messages.info(request, reason)
-        # Redirect to appropriate dashboard based on role
-        if request.user.role == 'manager':
-            return redirect('users:manager_dashboard')
-        elif request.user.role == 'person_centered_manager':
-            return redirect('users:pcm_dashboard')
-        else:
-            return redirect('users:volunteer_dashboard')
-    
-    # Get all active (non-archived) programs
-    programs = Program.objects.filter(archived=False).order_by('name')
-    
-    # Get user's existing enrollments to mark already enrolled programs
-    enrolled_program_ids = request.user.enrollments.values_list('program_id', flat=True)
-    
     context = {
-        'programs': programs,
-        'enrolled_program_ids': list(enrolled_program_ids),
-        'enrollment_settings': enrollment_settings,
+        **_catalog_context(request.user),
+        'enrollment_settings': request.enrollment_settings,
         'is_volunteer': True,
     }
     
@@ -387,6 +422,7 @@ def volunteer_program_catalog_view(request):
 
 @login_required
 @require_http_methods(["GET", "POST"])
+@require_enrollment_open("enrolling", roles=VOLUNTEER_ROLES)
 def volunteer_program_selection_view(request):
     """
     Handle volunteer program selection and ranking.
@@ -394,34 +430,6 @@ def volunteer_program_selection_view(request):
     GET: Display selection interface with selected programs from URL
     POST: Process ranked selections and directly create enrollments
     """
-    # Check if user is a volunteer, manager, or person-centered manager
-    if request.user.role not in ['volunteer', 'manager', 'person_centered_manager']:
-        messages.error(request, "This page is only accessible to volunteers, managers, and person-centered managers.")
-        return redirect('home')
-    
-    enrollment_settings = EnrollmentSettings.get_settings()
-    
-    # Check if user meets enrollment requirements
-    meets_requirements, missing_items = request.user.enrollment_requirements_status
-    if not meets_requirements:
-        messages.warning(
-            request,
-            f"Please complete the following before enrolling: {', '.join(missing_items)}"
-        )
-        return redirect('users:detail', username=request.user.username)
-    
-    # Check if enrollment is open
-    if not enrollment_settings.enrollment_open:
-        reason = enrollment_settings.closure_reason or "Registration is currently closed."
-        messages.info(request, reason)
-        # Redirect to appropriate dashboard based on role
-        if request.user.role == 'manager':
-            return redirect('users:manager_dashboard')
-        elif request.user.role == 'person_centered_manager':
-            return redirect('users:pcm_dashboard')
-        else:
-            return redirect('users:volunteer_dashboard')
-    
     if request.method == 'POST':
         # Get selected program IDs and their rankings from POST data
         try:
@@ -429,39 +437,23 @@ def volunteer_program_selection_view(request):
             
             if not selections_data:
                 messages.error(request, "Please select at least one program.")
-                return redirect('portal:volunteer_program_catalog')
+                return redirect_to('portal:volunteer_program_catalog')
             
-            # Validate all programs exist and are available
-            program_ids = [item['program_id'] for item in selections_data]
-            programs = Program.objects.filter(
-                program_id__in=program_ids,
-                archived=False
-            )
+            # Validate all programs exist and are available (one query)
+            program_ids = {item['program_id'] for item in selections_data}
+            programs_by_id = {
+                str(pk): program
+                for pk, program in Program.objects.filter(archived=False).in_bulk(
+                    program_ids, field_name='program_id'
+                ).items()
+            }
             
-            if len(programs) != len(program_ids):
+            if len(programs_by_id) != len(program_ids):
                 messages.error(request, "Some selected programs are no longer available.")
-                return redirect('portal:volunteer_program_catalog')
+                return redirect_to('portal:volunteer_program_catalog')
             
             # Create enrollments directly (no payment needed for volunteers)
-            enrollments_created = []
-            
-            for selection in selections_data:
-                program = get_object_or_404(
-                    Program,
-                    program_id=selection['program_id'],
-                    archived=False
-                )
-                
-                # Create or update enrollment
-                enrollment, created = Enrollment.objects.update_or_create(
-                    user=request.user,
-                    program=program,
-                    defaults={
-                        'status': 'pending',  # Will be reviewed by staff
-                        'preference_order': selection['rank'],
-                    }
-                )
-                enrollments_created.append(enrollment)
+            enrollments_created = upsert_pending_enrollments(request.user, selections_data, programs_by_id)
             
             messages.success(
                 request,
@@ -471,42 +463,36 @@ def volunteer_program_selection_view(request):
             
             # Redirect to appropriate dashboard based on role
             if request.user.role == 'manager':
-                return redirect('users:manager_dashboard')
+                return redirect_to('users:manager_dashboard')
             elif request.user.role == 'person_centered_manager':
-                return redirect('users:pcm_dashboard')
+                return redirect_to('users:pcm_dashboard')
             else:
-                return redirect('users:volunteer_dashboard')
+                return redirect_to('users:volunteer_dashboard')
             
         except (json.JSONDecodeError, KeyError) as e:
             messages.error(request, "Invalid selection data. Please try again.")
-            return redirect('portal:volunteer_program_catalog')
+            return redirect_to('portal:volunteer_program_catalog')
     
     # GET request - get program IDs from URL parameter
     programs_param = request.GET.get('programs', '')
     
     if not programs_param:
         messages.warning(request, "No programs selected. Please select programs first.")
-        return redirect('portal:volunteer_program_catalog')
+        return redirect_to('portal:volunteer_program_catalog')
     
     # Parse program IDs from comma-separated string
     program_ids = [pid.strip() for pid in programs_param.split(',') if pid.strip()]
     
     if not program_ids:
         messages.warning(request, "No programs selected. Please select programs first.")
-        return redirect('portal:volunteer_program_catalog')
+        return redirect_to('portal:volunteer_program_catalog')
     
     # Get program objects (maintain order from URL)
-    selected_programs = []
-    for program_id in program_ids:
-        try:
-            program = Program.objects.get(program_id=program_id, archived=False)
-            selected_programs.append(program)
-        except Program.DoesNotExist:
-            continue
+    selected_programs = _active_programs_in_order(program_ids)
     
     if not selected_programs:
         messages.error(request, "Selected programs are not available.")
-        return redirect('portal:volunteer_program_catalog')
+        return redirect_to('portal:volunteer_program_catalog')
     
     context = {
         'selected_programs': selected_programs,
@@ -532,7 +518,7 @@ def manager_program_create_view(request):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, "This page is only accessible to managers.")
-        return redirect('home')
+        return redirect_to('home')
     
     if request.method == 'POST':
         # Extract form data
@@ -569,7 +555,7 @@ def manager_program_create_view(request):
             )
             
             messages.success(request, f"Program '{program.name}' created successfully!")
-            return redirect('portal:programs')
+            return redirect_to('portal:programs')
             
         except Exception as e:
             messages.error(request, f"Error creating program: {str(e)}")
@@ -594,7 +580,6 @@ def manager_program_edit_view(request, program_id):
     Accessible to managers, PCMs, and volunteer leads of the program.
     Volunteer leads have limited editing capabilities (name, description, photo only).
     """
-    from .models import ProgramVolunteerLead
     
     program = get_object_or_404(Program, program_id=program_id)
     
@@ -612,7 +597,7 @@ def manager_program_edit_view(request, program_id):
     # Deny access if user has no permissions
     if not (is_full_manager or is_volunteer_lead):
         messages.error(request, "You don't have permission to edit this program.")
-        return redirect('portal:programs')
+        return redirect_to('portal:programs')
     
     if request.method == 'POST':
         # Extract form data
@@ -657,7 +642,7 @@ def manager_program_edit_view(request, program_id):
             program.save()
             
             messages.success(request, f"Program '{program.name}' updated successfully!")
-            return redirect('portal:programs')
+            return redirect_to('portal:programs')
             
         except Exception as e:
             messages.error(request, f"Error updating program: {str(e)}")
@@ -679,6 +664,9 @@ def manager_program_edit_view(request, program_id):
     return render(request, 'portal/manager_program_form.html', context)
 
 
+ADD_USER_SEARCH_TIMEOUT = 60
+
+
 @login_required
 @require_http_methods(["GET", "POST"])
 def manager_program_add_user_view(request, program_id):
@@ -689,7 +677,7 @@ def manager_program_add_user_view(request, program_id):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, "This page is only accessible to managers.")
-        return redirect('home')
+        return redirect_to('home')
     
     program = get_object_or_404(Program, program_id=program_id)
     
@@ -702,9 +690,6 @@ def manager_program_add_user_view(request, program_id):
         next_page = request.POST.get('next', 'all_members')
         
         try:
-            from inclusive_world_portal.users.models import User
-            from .models import Enrollment, EnrollmentStatus
-            
             user = get_object_or_404(User, id=user_id)
             
             # Check if already enrolled
@@ -722,34 +707,37 @@ def manager_program_add_user_view(request, program_id):
                 )
                 messages.success(request, f"Successfully added {user.name} to the program with pending status.")
             
-            from django.urls import reverse
             # Redirect to the appropriate page based on next parameter
             if next_page == 'all_volunteers':
-                return redirect(reverse('portal:all_volunteers') + f'?course={program_id}')
+                return HttpResponseRedirect(f'{Reversers.ALL_VOLUNTEERS}?course={program_id}')
             else:
-                return redirect(reverse('portal:all_members') + f'?course={program_id}')
+                return HttpResponseRedirect(f'{Reversers.ALL_MEMBERS}?course={program_id}')
         except Exception as e:
             messages.error(request, f"Error adding user: {str(e)}")
             return redirect('portal:program_add_user', program_id=program_id)
     
     # GET request - search users
     query = request.GET.get('q', '').strip()
-    users: list[object] = []
+    users: list[dict] = []
     enrolled_user_ids = []
     
     if query:
-        from inclusive_world_portal.users.models import User
-        from django.db.models import Q
-        
-        # Search for users by name, username, or email
-        users = list(User.objects.filter(
-            Q(username__icontains=query) |
-            Q(email__icontains=query) |
-            Q(name__icontains=query)
-        ).order_by('name', 'username')[:20])
+        # Search for users by name, username, or email. Results don't depend
+        # on the program, so repeated searches share a short-lived cache entry
+        # of plain rows, keyed on a hash so any query makes a valid key
+        cache_key = f"portal:add_user_search:{hashlib.md5(query.lower().encode()).hexdigest()}"
+        rows = cache.get(cache_key)
+        if rows is None:
+            rows = list(User.objects.filter(
+                Q(username__icontains=query) |
+                Q(email__icontains=query) |
+                Q(name__icontains=query)
+            ).order_by('name', 'username').values('id', 'name', 'username', 'email', 'role')[:20])
+            cache.set(cache_key, rows, ADD_USER_SEARCH_TIMEOUT)
+        # Labels are looked up per request so they follow the active language
+        users = [{**row, 'role_display': User.Role(row['role']).label} for row in rows]
         
         # Get list of already enrolled user IDs
-        from .models import Enrollment
         enrolled_user_ids = list(
             Enrollment.objects.filter(program=program)
             .values_list('user_id', flat=True)
@@ -766,8 +754,26 @@ def manager_program_add_user_view(request, program_id):
     return render(request, 'portal/manager_program_add_user.html', context)
 
 
+def _attendance_list_etag(request, program_id):
+    """
+    ETag for a program's attendance list. The row count catches deletions
+    and the newest updated_at catches additions and edits, so an unchanged
+    list is answered with a 304 instead of re-running the GROUP BY.
+    No tag (so no query) for non-managers, whom the view redirects, or while
+    flash messages are pending, since a 304 would swallow them.
+    """
+    if request.user.role != 'manager' or len(messages.get_messages(request)):
+        return None
+    stats = AttendanceRecord.objects.filter(program_id=program_id).aggregate(
+        count=Count('pk'), latest=Max('updated_at'),
+    )
+    latest = stats['latest'].timestamp() if stats['latest'] else 0
+    return f"{request.user.pk}-{stats['count']}-{latest}"
+
+
 @login_required
 @require_http_methods(["GET"])
+@condition(etag_func=_attendance_list_etag)
 def manager_program_attendance_list_view(request, program_id):
     """
     List all attendance records for a program.
@@ -777,14 +783,10 @@ def manager_program_attendance_list_view(request, program_id):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, "This page is only accessible to managers.")
-        return redirect('home')
+        return redirect_to('home')
     
     program = get_object_or_404(Program, program_id=program_id)
     
-    from .models import AttendanceRecord
-    from datetime import date
-    from django.db.models import Count
-    
     # Get all unique attendance dates for this program, ordered by date descending
     attendance_dates = AttendanceRecord.objects.filter(
         program=program
@@ -810,13 +812,10 @@ def manager_program_attendance_delete_view(request, program_id):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, "This page is only accessible to managers.")
-        return redirect('home')
+        return redirect_to('home')
     
     program = get_object_or_404(Program, program_id=program_id)
     
-    from .models import AttendanceRecord
-    from datetime import datetime
-    
     # Get the date from POST data
     attendance_date_str = request.POST.get('date')
     if not attendance_date_str:
@@ -826,7 +825,9 @@ def manager_program_attendance_delete_view(request, program_id):
     try:
         attendance_date = datetime.strptime(attendance_date_str, '%Y-%m-%d').date()
         
-        # Delete all attendance records for this program and date
+        # Delete all attendance records for this program and date. Nothing
+        # cascades from AttendanceRecord and it has no delete signals, so
+        # Django's fast-delete path issues one DELETE with no SELECT first
         deleted_count, _ = AttendanceRecord.objects.filter(
             program=program,
             attendance_date=attendance_date
@@ -860,19 +861,14 @@ def manager_program_attendance_view(request, program_id):
     # Check if user is a manager
     if request.user.role != 'manager':
         messages.error(request, "This page is only accessible to managers.")
-        return redirect('home')
+        return redirect_to('home')
     
     program = get_object_or_404(Program, program_id=program_id)
     
-    from .models import Enrollment, EnrollmentStatus, AttendanceRecord, AttendanceStatus
-    from inclusive_world_portal.users.models import User
-    from datetime import date
-    
     # Get attendance date from query parameter or default to today
     attendance_date_str = request.GET.get('date', '')
     if attendance_date_str:
         try:
-            from datetime import datetime
             attendance_date = datetime.strptime(attendance_date_str, '%Y-%m-%d').date()
         except ValueError:
             attendance_date = date.today()
@@ -885,76 +881,98 @@ def manager_program_attendance_view(request, program_id):
             # Get the date from POST data
             attendance_date_str = request.POST.get('attendance_date')
             if attendance_date_str:
-                from datetime import datetime
                 attendance_date = datetime.strptime(attendance_date_str, '%Y-%m-%d').date()
             
-            # Process each user's attendance
-            for key, value in request.POST.items():
-                if key.startswith('attendance_status_'):
-                    user_id = key.replace('attendance_status_', '')
-                    attendance_status_value = value
-                    
-                    # Get hours and notes for this user
-                    hours_str = request.POST.get(f'hours_{user_id}', '').strip()
-                    notes = request.POST.get(f'notes_{user_id}', '').strip()
-                    
-                    # Parse hours (only for volunteers)
-                    hours = None
-                    if hours_str:
-                        try:
-                            hours = float(hours_str)
-                        except ValueError:
-                            pass
-                    
-                    # Get the user
+            # Fetch every user on the form in one query
+            statuses_by_user_id = {
+                key.replace('attendance_status_', ''): value
+                for key, value in request.POST.items()
+                if key.startswith('attendance_status_')
+            }
+            users_by_id = {
+                str(pk): user
+                for pk, user in User.objects.in_bulk(list(statuses_by_user_id)).items()
+            }
+            
+            # Build every user's attendance record, then write them all in one
+            # INSERT ... ON CONFLICT on (program, user, attendance_date)
+            records = []
+            for user_id, attendance_status_value in statuses_by_user_id.items():
+                user = users_by_id.get(user_id)
+                if user is None:
+                    continue
+                
+                # Get hours and notes for this user
+                hours_str = request.POST.get(f'hours_{user_id}', '').strip()
+                notes = request.POST.get(f'notes_{user_id}', '').strip()
+                
+                # Parse hours (only for volunteers)
+                hours = None
+                if hours_str:
                     try:
-                        user = User.objects.get(id=user_id)
-                    except User.DoesNotExist:
-                        continue
-                    
-                    # Create or update attendance record
-                    AttendanceRecord.objects.update_or_create(
-                        program=program,
-                        user=user,
-                        attendance_date=attendance_date,
-                        defaults={
-                            'attendance_status': attendance_status_value,
-                            'hours': hours,
-                            'notes': notes,
-                        }
-                    )
+                        hours = float(hours_str)
+                    except ValueError:
+                        pass
+                
+                records.append(AttendanceRecord(
+                    program=program,
+                    user=user,
+                    attendance_date=attendance_date,
+                    attendance_status=attendance_status_value,
+                    hours=hours,
+                    notes=notes,
+                ))
+            
+            with transaction.atomic():
+                AttendanceRecord.objects.bulk_create(
+                    records,
+                    update_conflicts=True,
+                    unique_fields=['program', 'user', 'attendance_date'],
+                    # updated_at takes the incoming row's DEFAULT now(), which
+                    # the attendance list's ETag relies on
+                    update_fields=['attendance_status', 'hours', 'notes', 'updated_at'],
+                )
             
             messages.success(request, f"Attendance saved for {attendance_date.strftime('%B %d, %Y')}.")
             return redirect('portal:program_attendance', program_id=program_id)
             
         except Exception as e:
             messages.error(request, f"Error saving attendance: {str(e)}")
-            return redirect(request.path)
+            return HttpResponseRedirect(request.path)
     
     # GET request - gather all data
-    # Get all approved enrollments for this program
+    # Approved enrollments for this program, each LEFT JOINed to the user's
+    # attendance record for this date (if any) in the same query. The
+    # (program, user, attendance_date) constraint means at most one match
     approved_enrollments = Enrollment.objects.filter(
         program=program,
         status=EnrollmentStatus.APPROVED
-    ).select_related('user').order_by('user__name')
-    
-    # Get existing attendance records for this date
-    existing_attendance = AttendanceRecord.objects.filter(
-        program=program,
-        attendance_date=attendance_date
-    ).select_related('user')
-    
-    # Create a map of user_id -> attendance_record
-    attendance_map = {ar.user_id: ar for ar in existing_attendance}
-    
-    # Prepare participants list with attendance data
+    ).annotate(
+        attendance=FilteredRelation(
+            'user__attendance_records',
+            condition=Q(
+                user__attendance_records__program=program,
+                user__attendance_records__attendance_date=attendance_date,
+            ),
+        ),
+        recorded_status=F('attendance__attendance_status'),
+        recorded_hours=F('attendance__hours'),
+        recorded_notes=F('attendance__notes'),
+    ).select_related('user').only(
+        # Only the user columns the sheet renders; skips bio, support needs
+        # and the rest of the profile
+        'user__name', 'user__username', 'user__role',
+    ).order_by('user__name')
+    
+    # Prepare participants list with attendance data; the queryset is read
+    # once, so stream it instead of filling its result cache
     participants = []
-    for enrollment in approved_enrollments:
+    for enrollment in approved_enrollments.iterator(chunk_size=500):
         user = enrollment.user
-        attendance_record = attendance_map.get(user.id)
+        has_record = enrollment.recorded_status is not None
         
         # Determine if user is a volunteer (includes managers and person-centered managers)
-        is_volunteer = user.role in ['volunteer', 'manager', 'person_centered_manager']
+        is_volunteer = user.role in VOLUNTEER_ROLES
         
         # Default values: 'present' for attendance, 1.5 hours for volunteers
         default_attendance_status = 'present'
@@ -964,9 +982,9 @@ def manager_program_attendance_view(request, program_id):
             'user': user,
             'role': user.get_role_display() if hasattr(user, 'get_role_display') else user.role.title(),
             'is_volunteer': is_volunteer,
-            'attendance_status': attendance_record.attendance_status if attendance_record else default_attendance_status,
-            'hours': attendance_record.hours if attendance_record else default_hours,
-            'notes': attendance_record.notes if attendance_record else '',
+            'attendance_status': enrollment.recorded_status if has_record else default_attendance_status,
+            'hours': enrollment.recorded_hours if has_record else default_hours,
+            'notes': enrollment.recorded_notes if has_record else '',
         })
     
     context = {
@@ -985,22 +1003,22 @@ def my_attendance_view(request):
     Display user's attendance records across all programs.
     Shows total hours for volunteers.
     """
-    from decimal import Decimal
-    from .models import AttendanceRecord
     
     # Get all attendance records for the user, ordered by date (most recent first)
     attendance_records = AttendanceRecord.objects.filter(
         user=request.user
-    ).select_related('program').order_by('-attendance_date')
+    ).select_related('program').only(
+        # The table shows the program's name, not its description or image
+        'attendance_date', 'attendance_status', 'hours', 'notes', 'program__name',
+    ).order_by('-attendance_date')
     
     # Calculate total hours if user is a volunteer (includes managers and person-centered managers)
     total_hours = Decimal('0.00')
-    is_volunteer = request.user.role in ['volunteer', 'manager', 'person_centered_manager']
+    is_volunteer = request.user.role in VOLUNTEER_ROLES
     
     if is_volunteer:
-        for record in attendance_records:
-            if record.hours:
-                total_hours += record.hours
+        # Let the database add up the hours; the template lists the rows
+        total_hours = attendance_records.aggregate(total=Sum('hours'))['total'] or total_hours
     
     context = {
         'attendance_records': attendance_records,
@@ -1024,7 +1042,6 @@ def all_members_view(request):
     Volunteer leads can only view members enrolled in programs they lead.
     Note: Member roles cannot be changed from this view.
     """
-    from inclusive_world_portal.portal.models import ProgramVolunteerLead
     
     # Check if user is a manager, person-centered manager, or volunteer lead
     is_manager_or_pcm = request.user.role in ['manager', 'person_centered_manager']
@@ -1035,10 +1052,7 @@ def all_members_view(request):
     
     if not (is_manager_or_pcm or is_volunteer_lead):
         messages.error(request, "This page is only accessible to managers, person-centered managers, and program leads.")
-        return redirect('home')
-    
-    from inclusive_world_portal.users.models import User
-    from django.db.models import Q
+        return redirect_to('home')
     
     # Handle POST requests for status updates (managers only)
     if request.method == 'POST' and request.user.role == 'manager':
@@ -1049,16 +1063,17 @@ def all_members_view(request):
             new_status = request.POST.get('status')
             
             try:
-                member = get_object_or_404(User, id=user_id)
-                
-                # Validate status
-                valid_statuses = [choice[0] for choice in User.Status.choices]
-                if new_status in valid_statuses:
-                    member.status = new_status
-                    member.save()
-                    messages.success(request, f"Status updated for {member.name or member.username}.")
-                else:
+                # Validate status, then write it in one UPDATE (the only read is
+                # the name for the message)
+                if new_status not in _VALID_USER_STATUSES:
                     messages.error(request, "Invalid status selection.")
+                else:
+                    user_name = _user_display_name(user_id)
+                    if user_name is None:
+                        messages.error(request, "User not found.")
+                    else:
+                        User.objects.filter(id=user_id).update(status=new_status)
+                        messages.success(request, f"Status updated for {user_name}.")
             except Exception as e:
                 messages.error(request, f"Error updating status: {str(e)}")
             
@@ -1066,35 +1081,18 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
         
         elif action == 'update_enrollment_status':
             enrollment_id = request.POST.get('enrollment_id')
             new_status = request.POST.get('enrollment_status')
             
             try:
-                enrollment = get_object_or_404(Enrollment, enrollment_id=enrollment_id)
-                
                 # Validate status
-                valid_statuses = [choice[0] for choice in EnrollmentStatus.choices]
-                if new_status in valid_statuses:
-                    old_status = enrollment.status
-                    enrollment.status = new_status
-                    enrollment.assigned_by = request.user
-                    enrollment.assigned_at = timezone.now()
-                    enrollment.save()
-                    
-                    # Update program enrolled count if status changed to/from approved
-                    program = enrollment.program
-                    if old_status != EnrollmentStatus.APPROVED and new_status == EnrollmentStatus.APPROVED:
-                        program.enrolled += 1
-                        program.save()
-                    elif old_status == EnrollmentStatus.APPROVED and new_status != EnrollmentStatus.APPROVED:
-                        program.enrolled = max(0, program.enrolled - 1)
-                        program.save()
+                if new_status in _VALID_ENROLLMENT_STATUSES:
+                    enrollment = _set_enrollment_status(enrollment_id, new_status, request.user)
                     
                     messages.success(request, f"Enrollment status updated for {enrollment.user.name or enrollment.user.username}.")
                 else:
@@ -1106,10 +1104,9 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
         
         elif action == 'update_support_needs':
             user_id = request.POST.get('user_id')
@@ -1127,13 +1124,11 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
         
         elif action == 'assign_buddy':
-            from .models import BuddyAssignment
             member_id = request.POST.get('member_id')
             volunteer_id = request.POST.get('volunteer_id', '').strip()
             enrollment_id = request.POST.get('enrollment_id')
@@ -1172,17 +1167,15 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
     
     # Handle buddy assignment and support needs POST requests for PCMs and volunteer leads
     elif request.method == 'POST' and (is_manager_or_pcm or is_volunteer_lead):
         action = request.POST.get('action')
         
         if action == 'assign_buddy':
-            from .models import BuddyAssignment
             member_id = request.POST.get('member_id')
             volunteer_id = request.POST.get('volunteer_id', '').strip()
             enrollment_id = request.POST.get('enrollment_id')
@@ -1196,7 +1189,7 @@ def all_members_view(request):
                 if is_volunteer_lead and not is_manager_or_pcm:
                     if program.program_id not in user_led_program_ids:
                         messages.error(request, "You can only manage buddy assignments for programs you lead.")
-                        return redirect('portal:all_members')
+                        return redirect_to('portal:all_members')
                 
                 # If volunteer_id is empty, remove the buddy assignment
                 if not volunteer_id:
@@ -1227,10 +1220,9 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
         
         elif action == 'update_support_needs':
             user_id = request.POST.get('user_id')
@@ -1247,7 +1239,7 @@ def all_members_view(request):
                     )
                     if not member_program_ids.intersection(user_led_program_ids):
                         messages.error(request, "You can only edit support needs for members in programs you lead.")
-                        return redirect('portal:all_members')
+                        return redirect_to('portal:all_members')
                 
                 member.support_needs = support_needs
                 member.save()
@@ -1259,17 +1251,27 @@ def all_members_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_members'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_members') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_members')
+                redirect_url = f'{Reversers.ALL_MEMBERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_members')
     
     # Get course filter from query params
     course_filter = request.GET.get('course', '').strip()
     
+    # Each member enrollment carries its buddy's id from a correlated
+    # subquery; volunteer leads only see buddies in programs they lead
+    buddies = BuddyAssignment.objects.filter(
+        program_id=OuterRef('program_id'), member_user_id=OuterRef('user_id')
+    )
+    if is_volunteer_lead and not is_manager_or_pcm:
+        buddies = buddies.filter(program_id__in=user_led_program_ids)
+    member_enrollments = Enrollment.objects.select_related('program').annotate(
+        buddy_volunteer_id=Subquery(buddies.values('volunteer_user_id')[:1])
+    )
+    
     # Get all members ordered by name with prefetched enrollment data
-    members_query = User.objects.filter(role='member').prefetch_related(
-        'enrollments__program'
+    members_query = User.objects.filter(role='member').only(*_PEOPLE_LIST_FIELDS).prefetch_related(
+        Prefetch('enrollments', queryset=member_enrollments)
     )
     
     # For volunteer leads, restrict to members in programs they lead
@@ -1285,7 +1287,7 @@ def all_members_view(request):
         if is_volunteer_lead and not is_manager_or_pcm:
             if course_filter not in [str(pid) for pid in user_led_program_ids]:
                 messages.error(request, "You can only view members from programs you lead.")
-                return redirect('portal:all_members')
+                return redirect_to('portal:all_members')
         
         members_query = members_query.filter(
             enrollments__program__program_id=course_filter
@@ -1296,17 +1298,18 @@ def all_members_view(request):
         except Program.DoesNotExist:
             pass
     
-    members = members_query.order_by('name')
+    members = members_query.annotate(
+        has_published_doc=_published_document_exists()
+    ).order_by('name')
     
-    # If filtering by course, get the enrollment for each member in that course
+    # If filtering by course, pick each member's enrollment in that course out
+    # of the prefetched ones
     course_enrollments = {}
     if course_filter and filtered_program:
-        enrollments = Enrollment.objects.filter(
-            program=filtered_program,
-            user__in=members
-        ).select_related('user')
-        for enrollment in enrollments:
-            course_enrollments[enrollment.user.id] = enrollment
+        for member in members:
+            for enrollment in member.enrollments.all():
+                if enrollment.program_id == filtered_program.program_id:
+                    course_enrollments[member.id] = enrollment
     
     # Check if user can edit status/role fields (only managers can)
     can_edit_status = request.user.role == 'manager'
@@ -1317,50 +1320,33 @@ def all_members_view(request):
     # Check if user can edit support needs (managers, PCMs, and volunteer leads can)
     can_edit_support_needs = is_manager_or_pcm or is_volunteer_lead
     
-    # Note: users_with_active_opd removed - legacy OPD system replaced with Document model
-    users_with_active_opd: set[int] = set()  # Keep for template compatibility
-    
-    # Build program volunteers mapping and buddy assignments for the enrollments partial
+    # Build program volunteers mapping for the enrollments partial's buddy dropdowns
     program_volunteers = {}
-    buddy_map = {}
     
-    # Build buddy assignment data if user can view/edit buddies
+    # Build buddy dropdown options if user can view/edit buddies
     if can_edit_buddy:
         # Get all unique programs that members are enrolled in
         program_ids = set()
         for member in members:
             for enrollment in member.enrollments.all():
-                program_ids.add(enrollment.program.program_id)
+                program_ids.add(enrollment.program_id)
         
         # For volunteer leads, restrict to programs they lead
         if is_volunteer_lead and not is_manager_or_pcm:
             program_ids = program_ids.intersection(user_led_program_ids)
         
-        # For each program, get approved volunteers
-        for program_id in program_ids:
-            volunteers = User.objects.filter(
-                role__in=['volunteer', 'manager', 'person_centered_manager'],
-                enrollments__program__program_id=program_id,
-                enrollments__status=EnrollmentStatus.APPROVED
-            ).distinct().order_by('name')
-            program_volunteers[str(program_id)] = list(volunteers)
-        
-        # Get all buddy assignments for these members
-        from .models import BuddyAssignment
-        buddy_assignments = BuddyAssignment.objects.filter(
-            member_user__in=members
-        ).select_related('volunteer_user', 'program')
-        
-        # For volunteer leads, only show buddy assignments for their programs
-        if is_volunteer_lead and not is_manager_or_pcm:
-            buddy_assignments = buddy_assignments.filter(
-                program__program_id__in=user_led_program_ids
-            )
-        
-        # Build buddy_map keyed by (program_id, member_id) tuple
-        for assignment in buddy_assignments:
-            key = (str(assignment.program.program_id), assignment.member_user_id)
-            buddy_map[key] = assignment.volunteer_user_id
+        # Approved volunteers for all of those programs in one query, grouped
+        # per program (the (user, program) constraint keeps them distinct).
+        # The dropdowns only show id and name, so plain dicts are enough
+        program_volunteers = {str(program_id): [] for program_id in program_ids}
+        volunteer_rows = Enrollment.objects.filter(
+            program_id__in=program_ids,
+            status=EnrollmentStatus.APPROVED,
+            user__role__in=VOLUNTEER_ROLES,
+        ).order_by('user__name').values_list('program_id', 'user_id', 'user__name', 'user__username')
+        for program_id, user_id, name, username in volunteer_rows:
+            program_volunteers[str(program_id)].append({'id': user_id, 'name': name, 'username': username})
+
     
     # Get all available programs for filter dropdown
     # For volunteer leads, only show programs they lead
@@ -1378,10 +1364,8 @@ def all_members_view(request):
         'can_edit_buddy': can_edit_buddy,  # For buddy assignments (managers, PCMs, volunteer leads)
         'can_edit_support_needs': can_edit_support_needs,  # For support needs (managers, PCMs, volunteer leads)
         'status_choices': User.Status.choices,
-        'users_with_active_opd': users_with_active_opd,
         'enrollment_statuses': EnrollmentStatus.choices,
         'program_volunteers': program_volunteers,
-        'buddy_map': buddy_map,
         'enrollment_user_role': 'member',
         'all_programs': all_programs,
         'course_filter': course_filter,
@@ -1401,7 +1385,6 @@ def all_volunteers_view(request):
     Volunteer leads can only view volunteers enrolled in programs they lead.
     Note: Volunteers cannot be changed to members from this view.
     """
-    from inclusive_world_portal.portal.models import ProgramVolunteerLead
     
     # Check if user is a manager, person-centered manager, or volunteer lead
     is_manager_or_pcm = request.user.role in ['manager', 'person_centered_manager']
@@ -1412,10 +1395,7 @@ def all_volunteers_view(request):
     
     if not (is_manager_or_pcm or is_volunteer_lead):
         messages.error(request, "This page is only accessible to managers, person-centered managers, and program leads.")
-        return redirect('home')
-    
-    from inclusive_world_portal.users.models import User
-    from django.db.models import Q
+        return redirect_to('home')
     
     # Handle POST requests for role/status updates (managers only)
     if request.method == 'POST' and request.user.role == 'manager':
@@ -1426,16 +1406,18 @@ def all_volunteers_view(request):
             new_role = request.POST.get('role')
             
             try:
-                volunteer = get_object_or_404(User, id=user_id)
-                
-                # Validate role - managers can assign volunteer, manager, or PCM roles (not member)
-                valid_roles = ['volunteer', 'person_centered_manager', 'manager']
-                if new_role in valid_roles:
-                    volunteer.role = new_role
-                    volunteer.save()
-                    messages.success(request, f"Role updated for {volunteer.name or volunteer.username}.")
-                else:
+                # Validate role - managers can assign volunteer, manager, or PCM
+                # roles (not member) - then write it in one UPDATE (the only read is
+                # the name for the message)
+                if new_role not in VOLUNTEER_ROLES:
                     messages.error(request, "Invalid role selection.")
+                else:
+                    user_name = _user_display_name(user_id)
+                    if user_name is None:
+                        messages.error(request, "User not found.")
+                    else:
+                        User.objects.filter(id=user_id).update(role=new_role)
+                        messages.success(request, f"Role updated for {user_name}.")
             except Exception as e:
                 messages.error(request, f"Error updating role: {str(e)}")
             
@@ -1443,26 +1425,26 @@ def all_volunteers_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_volunteers'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_volunteers') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_volunteers')
+                redirect_url = f'{Reversers.ALL_VOLUNTEERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_volunteers')
         
         elif action == 'update_status':
             user_id = request.POST.get('user_id')
             new_status = request.POST.get('status')
             
             try:
-                volunteer = get_object_or_404(User, id=user_id)
-                
-                # Validate status
-                valid_statuses = [choice[0] for choice in User.Status.choices]
-                if new_status in valid_statuses:
-                    volunteer.status = new_status
-                    volunteer.save()
-                    messages.success(request, f"Status updated for {volunteer.name or volunteer.username}.")
-                else:
+                # Validate status, then write it in one UPDATE (the only read is
+                # the name for the message)
+                if new_status not in _VALID_USER_STATUSES:
                     messages.error(request, "Invalid status selection.")
+                else:
+                    user_name = _user_display_name(user_id)
+                    if user_name is None:
+                        messages.error(request, "User not found.")
+                    else:
+                        User.objects.filter(id=user_id).update(status=new_status)
+                        messages.success(request, f"Status updated for {user_name}.")
             except Exception as e:
                 messages.error(request, f"Error updating status: {str(e)}")
             
@@ -1470,35 +1452,18 @@ def all_volunteers_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_volunteers'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_volunteers') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_volunteers')
+                redirect_url = f'{Reversers.ALL_VOLUNTEERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_volunteers')
         
         elif action == 'update_enrollment_status':
             enrollment_id = request.POST.get('enrollment_id')
             new_status = request.POST.get('enrollment_status')
             
             try:
-                enrollment = get_object_or_404(Enrollment, enrollment_id=enrollment_id)
-                
                 # Validate status
-                valid_statuses = [choice[0] for choice in EnrollmentStatus.choices]
-                if new_status in valid_statuses:
-                    old_status = enrollment.status
-                    enrollment.status = new_status
-                    enrollment.assigned_by = request.user
-                    enrollment.assigned_at = timezone.now()
-                    enrollment.save()
-                    
-                    # Update program enrolled count if status changed to/from approved
-                    program = enrollment.program
-                    if old_status != EnrollmentStatus.APPROVED and new_status == EnrollmentStatus.APPROVED:
-                        program.enrolled += 1
-                        program.save()
-                    elif old_status == EnrollmentStatus.APPROVED and new_status != EnrollmentStatus.APPROVED:
-                        program.enrolled = max(0, program.enrolled - 1)
-                        program.save()
+                if new_status in _VALID_ENROLLMENT_STATUSES:
+                    enrollment = _set_enrollment_status(enrollment_id, new_status, request.user)
                     
                     messages.success(request, f"Enrollment status updated for {enrollment.user.name or enrollment.user.username}.")
                 else:
@@ -1510,10 +1475,9 @@ def all_volunteers_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_volunteers'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_volunteers') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_volunteers')
+                redirect_url = f'{Reversers.ALL_VOLUNTEERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_volunteers')
         
         elif action == 'toggle_volunteer_lead':
             volunteer_id = request.POST.get('volunteer_id')
@@ -1521,24 +1485,31 @@ def all_volunteers_view(request):
             is_lead = request.POST.get('is_lead') == 'true'
             
             try:
-                from inclusive_world_portal.portal.models import ProgramVolunteerLead
-                volunteer = get_object_or_404(User, id=volunteer_id)
-                program = get_object_or_404(Program, program_id=program_id)
+                program = get_object_or_404(Program.objects.only('name'), program_id=program_id)
+                # Just the columns the messages need. Checking the id here
+                # also matters because the FK is only enforced at COMMIT,
+                # after this view has already reported success
+                volunteer = User.objects.filter(id=volunteer_id).values_list('name', 'username').first()
+                if volunteer is None:
+                    raise Http404("No User matches the given query.")
+                volunteer_name = volunteer[0] or volunteer[1]
                 
                 if is_lead:
-                    # Add volunteer as lead if not already
-                    ProgramVolunteerLead.objects.get_or_create(
-                        program=program,
-                        volunteer=volunteer
-                    )
-                    messages.success(request, f"{volunteer.name or volunteer.username} is now a volunteer lead for {program.name}.")
+                    # Add volunteer as lead if not already: one INSERT ... ON
+                    # CONFLICT DO NOTHING against lead_program_volunteer_uq
+                    with transaction.atomic():
+                        ProgramVolunteerLead.objects.bulk_create(
+                            [ProgramVolunteerLead(program=program, volunteer_id=volunteer_id)],
+                            ignore_conflicts=True,
+                        )
+                    messages.success(request, f"{volunteer_name} is now a volunteer lead for {program.name}.")
                 else:
                     # Remove volunteer lead status
                     ProgramVolunteerLead.objects.filter(
                         program=program,
-                        volunteer=volunteer
+                        volunteer_id=volunteer_id
                     ).delete()
-                    messages.success(request, f"{volunteer.name or volunteer.username} is no longer a volunteer lead for {program.name}.")
+                    messages.success(request, f"{volunteer_name} is no longer a volunteer lead for {program.name}.")
             except Exception as e:
                 messages.error(request, f"Error updating volunteer lead status: {str(e)}")
             
@@ -1546,18 +1517,17 @@ def all_volunteers_view(request):
             course_filter = request.POST.get('course_filter', '')
             redirect_url = 'portal:all_volunteers'
             if course_filter:
-                from django.urls import reverse
-                redirect_url = reverse('portal:all_volunteers') + f'?course={course_filter}'
-                return redirect(redirect_url)
-            return redirect('portal:all_volunteers')
+                redirect_url = f'{Reversers.ALL_VOLUNTEERS}?course={course_filter}'
+                return HttpResponseRedirect(redirect_url)
+            return redirect_to('portal:all_volunteers')
     
     # Get course filter from query params
     course_filter = request.GET.get('course', '').strip()
     
     # Get all volunteers, managers, and person-centered managers ordered by name with prefetched enrollment data
     volunteers_query = User.objects.filter(
-        role__in=['volunteer', 'manager', 'person_centered_manager']
-    ).prefetch_related(
+        role__in=VOLUNTEER_ROLES
+    ).only(*_PEOPLE_LIST_FIELDS).prefetch_related(
         'enrollments__program'
     )
     
@@ -1574,7 +1544,7 @@ def all_volunteers_view(request):
         if is_volunteer_lead and not is_manager_or_pcm:
             if course_filter not in [str(pid) for pid in user_led_program_ids]:
                 messages.error(request, "You can only view volunteers from programs you lead.")
-                return redirect('portal:all_volunteers')
+                return redirect_to('portal:all_volunteers')
         
         volunteers_query = volunteers_query.filter(
             enrollments__program__program_id=course_filter
@@ -1585,17 +1555,28 @@ def all_volunteers_view(request):
         except Program.DoesNotExist:
             pass
     
-    volunteers = volunteers_query.order_by('name')
+    volunteers = volunteers_query.annotate(
+        has_published_doc=_published_document_exists()
+    )
+    
+    # When filtering by course, flag the volunteers who lead it in the same
+    # query
+    if filtered_program:
+        volunteers = volunteers.annotate(
+            is_lead=Exists(ProgramVolunteerLead.objects.filter(
+                program=filtered_program, volunteer=OuterRef('pk')
+            ))
+        )
+    volunteers = volunteers.order_by('name')
     
-    # If filtering by course, get the enrollment for each volunteer in that course
+    # If filtering by course, pick each volunteer's enrollment in that course
+    # out of the prefetched ones
     course_enrollments = {}
     if course_filter and filtered_program:
-        enrollments = Enrollment.objects.filter(
-            program=filtered_program,
-            user__in=volunteers
-        ).select_related('user')
-        for enrollment in enrollments:
-            course_enrollments[enrollment.user.id] = enrollment
+        for volunteer in volunteers:
+            for enrollment in volunteer.enrollments.all():
+                if enrollment.program_id == filtered_program.program_id:
+                    course_enrollments[volunteer.id] = enrollment
     
     # Check if user can edit (managers can, PCMs cannot)
     can_edit = request.user.role == 'manager'
@@ -1607,9 +1588,6 @@ def all_volunteers_view(request):
         ('manager', 'Manager'),
     ]
     
-    # Note: users_with_active_opd removed - legacy OPD system replaced with Document model
-    users_with_active_opd: set[int] = set()  # Keep for template compatibility
-    
     # Get all available programs for filter dropdown
     # For volunteer leads, only show programs they lead
     if is_volunteer_lead and not is_manager_or_pcm:
@@ -1620,14 +1598,6 @@ def all_volunteers_view(request):
     else:
         all_programs = Program.objects.filter(archived=False).order_by('name')
     
-    # Get volunteer leads for the filtered program if applicable
-    volunteer_leads = set()
-    if course_filter and filtered_program:
-        lead_user_ids = ProgramVolunteerLead.objects.filter(
-            program=filtered_program
-        ).values_list('volunteer_id', flat=True)
-        volunteer_leads = set(lead_user_ids)
-    
     # Note: Volunteers don't need buddy assignments, so we don't build those maps
     # We still pass enrollment_statuses for the status dropdown
     context = {
@@ -1635,16 +1605,13 @@ def all_volunteers_view(request):
         'can_edit': can_edit,
         'role_choices': volunteer_role_choices if can_edit else [],
         'status_choices': User.Status.choices,
-        'users_with_active_opd': users_with_active_opd,
         'enrollment_statuses': EnrollmentStatus.choices,
         'program_volunteers': {},  # Empty since volunteers don't have buddies
-        'buddy_map': {},  # Empty since volunteers don't have buddies
         'enrollment_user_role': 'volunteer',
         'all_programs': all_programs,
         'course_filter': course_filter,
         'filtered_program': filtered_program,
         'course_enrollments': course_enrollments,
-        'volunteer_leads': volunteer_leads,
     }
     
     return render(request, 'portal/all_volunteers.html', context)
@@ -1668,33 +1635,19 @@ def ajax_update_enrollment_status(request):
         enrollment_id = request.POST.get('enrollment_id')
         new_status = request.POST.get('status')
         
-        enrollment = get_object_or_404(Enrollment, enrollment_id=enrollment_id)
-        
         # Validate status
-        valid_statuses = [choice[0] for choice in EnrollmentStatus.choices]
-        if new_status not in valid_statuses:
+        if new_status not in _VALID_ENROLLMENT_STATUSES:
             return JsonResponse({'error': 'Invalid status'}, status=400)
         
-        old_status = enrollment.status
-        enrollment.status = new_status
-        enrollment.assigned_by = request.user
-        enrollment.assigned_at = timezone.now()
-        enrollment.save()
-        
-        # Update program enrolled count if status changed to/from approved
-        program = enrollment.program
-        if old_status != EnrollmentStatus.APPROVED and new_status == EnrollmentStatus.APPROVED:
-            program.enrolled += 1
-            program.save()
-        elif old_status == EnrollmentStatus.APPROVED and new_status != EnrollmentStatus.APPROVED:
-            program.enrolled = max(0, program.enrolled - 1)
-            program.save()
+        enrollment = _set_enrollment_status(enrollment_id, new_status, request.user)
         
         return JsonResponse({
             'success': True,
             'status': new_status,
             'status_display': enrollment.get_status_display()
         })
+    except ProgramFullError as e:
+        return JsonResponse({'error': str(e)}, status=409)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
@@ -1713,8 +1666,6 @@ def ajax_update_buddy_assignment(request):
         enrollment_id = request.POST.get('enrollment_id')
         volunteer_id = request.POST.get('volunteer_id', '').strip()
         
-        from inclusive_world_portal.users.models import User
-        
         enrollment = get_object_or_404(Enrollment, enrollment_id=enrollment_id)
         member = enrollment.user
         program = enrollment.program
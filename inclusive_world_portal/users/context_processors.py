@@ -1,5 +1,7 @@
 from django.conf import settings
 
+from inclusive_world_portal.portal.models import EnrollmentSettings, RoleEnrollmentRequirement
+
 
 def allauth_settings(request):
     """Expose some settings from django-allauth in templates."""
@@ -16,26 +18,22 @@ def user_alerts(request):
     context = {}
     
     if request.user.is_authenticated:
-        from inclusive_world_portal.users.models import User
-        
         # Check enrollment requirements
         meets_requirements, missing_items = request.user.enrollment_requirements_status
         
-        # Import here to avoid circular dependency
-        from inclusive_world_portal.portal.models import EnrollmentSettings, RoleEnrollmentRequirement
         enrollment_settings = EnrollmentSettings.get_settings()
         enrollment_open = enrollment_settings.enrollment_open
         
         show_requirements_alert = not meets_requirements
         
         # Get required surveys for the user's role
-        required_survey_ids = []
+        required_survey_ids: frozenset = frozenset()
         try:
             requirement = RoleEnrollmentRequirement.objects.get(
                 role=request.user.role,
                 is_active=True
             )
-            required_survey_ids = list(requirement.required_surveys.values_list('id', flat=True))
+            required_survey_ids = frozenset(requirement.required_surveys.values_list('id', flat=True))
         except RoleEnrollmentRequirement.DoesNotExist:
             pass
         
@@ -15,16 +15,16 @@ class DashboardView(LoginRequiredMixin, TemplateView):
     """
     
     def get(self, request, *args, **kwargs):
-        user = request.user
+        role = request.user.role
         
         # Redirect based on user role
-        if user.role == User.Role.MEMBER:
+        if role == User.Role.MEMBER:
             return redirect('users:member_dashboard')
-        elif user.role == User.Role.VOLUNTEER:
+        elif role == User.Role.VOLUNTEER:
             return redirect('users:volunteer_dashboard')
-        elif user.role == User.Role.PERSON_CENTERED_MANAGER:
+        elif role == User.Role.PERSON_CENTERED_MANAGER:
             return redirect('users:pcm_dashboard')
-        elif user.role == User.Role.MANAGER:
+        elif role == User.Role.MANAGER:
             return redirect('users:manager_dashboard')
         else:
             messages.warning(request, "Your account role is not configured. Please contact support.")
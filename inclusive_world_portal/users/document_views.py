@@ -113,7 +113,7 @@ class DocumentEditorView(LoginRequiredMixin, FormView):
         if document_id:
             target_user = self.get_target_user()
             try:
-                return Document.objects.get(document_id=document_id, user=target_user)
+                return Document.objects.with_content().get(document_id=document_id, user=target_user)
             except Document.DoesNotExist:
                 messages.error(self.request, _('Document not found.'))
                 return None
@@ -343,8 +343,8 @@ def toggle_document_publish(request, document_id):
         }, status=403)
     
     try:
-        # Get the document
-        document = get_object_or_404(Document, document_id=document_id)
+        # Get the document (with its HTML body, needed to render the PDF)
+        document = get_object_or_404(Document.objects.with_content(), document_id=document_id)
         
         # Toggle published status
         if document.published:
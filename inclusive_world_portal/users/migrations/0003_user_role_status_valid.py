@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-16 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_search_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(condition=models.Q(('role__in', ['member', 'volunteer', 'person_centered_manager', 'manager'])), name='user_role_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['active', 'inactive', 'suspended', 'pending_verification'])), name='user_status_valid'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.conf import settings
 from django.db import models
 from django.db.models import (
@@ -13,10 +14,28 @@ from django.db.models import (
     TextField,
     CASCADE,
 )
+from django.db.models.functions import Upper
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+# Module level so User.Meta's check constraints can list the values; use them
+# as User.Role and User.Status.
+class UserRole(models.TextChoices):
+    MEMBER = "member", _("Member")
+    VOLUNTEER = "volunteer", _("Volunteer")
+    PERSON_CENTERED_MANAGER = "person_centered_manager", _("Person Centered Manager")
+    MANAGER = "manager", _("Manager")
+
+
+class UserStatus(models.TextChoices):
+    ACTIVE = "active", _("Active")
+    INACTIVE = "inactive", _("Inactive")
+    SUSPENDED = "suspended", _("Suspended")
+    PENDING_VERIFICATION = "pending_verification", _("Pending Verification")
+
+
 class User(AbstractUser):
     """
     Default custom user model for inclusive-world-portal.
@@ -24,17 +43,8 @@ class User(AbstractUser):
     check forms.SignupForm and forms.SocialSignupForms accordingly.
     """
 
-    class Role(models.TextChoices):
-        MEMBER = "member", _("Member")
-        VOLUNTEER = "volunteer", _("Volunteer")
-        PERSON_CENTERED_MANAGER = "person_centered_manager", _("Person Centered Manager")
-        MANAGER = "manager", _("Manager")
-
-    class Status(models.TextChoices):
-        ACTIVE = "active", _("Active")
-        INACTIVE = "inactive", _("Inactive")
-        SUSPENDED = "suspended", _("Suspended")
-        PENDING_VERIFICATION = "pending_verification", _("Pending Verification")
+    Role = UserRole
+    Status = UserStatus
 
     # Basic Info
     name = CharField(_("Name of User"), blank=True, max_length=255)
@@ -82,6 +92,31 @@ class User(AbstractUser):
     
     phone_confirmed_at = DateTimeField(_("Phone Confirmed At"), null=True, blank=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Trigram index over the expressions Postgres compares for
+            # icontains (UPPER(col) LIKE UPPER('%q%')), so the people search
+            # doesn't scan the whole table
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="user_search_trgm_idx",
+            ),
+        ]
+        constraints = [
+            # The people pages write role/status with queryset.update(), which
+            # skips model validation; keep the choices enforced in Postgres
+            models.CheckConstraint(
+                condition=models.Q(role__in=UserRole.values),
+                name="user_role_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(status__in=UserStatus.values),
+                name="user_status_valid",
+            ),
+        ]
+
     def get_absolute_url(self) -> str:
         """Get URL for user's detail view.
 
@@ -110,21 +145,17 @@ class User(AbstractUser):
         Check if user meets enrollment requirements for their role.
         Uses the extensible RoleEnrollmentRequirement system.
         """
-        from inclusive_world_portal.portal.models import RoleEnrollmentRequirement
-        
-        try:
-            requirement = RoleEnrollmentRequirement.objects.get(role=self.role, is_active=True)
-            meets_requirements, _ = requirement.check_user_meets_requirements(self)
-            return meets_requirements
-        except RoleEnrollmentRequirement.DoesNotExist:
-            # No requirement configured - allow registration
-            return True
+        meets_requirements, _ = self.enrollment_requirements_status
+        return meets_requirements
     
-    @property
+    @cached_property
     def enrollment_requirements_status(self) -> tuple:
         """
         Get detailed status of enrollment requirements.
         Returns (meets_requirements: bool, missing_items: list)
+        
+        Cached on the instance: views, the user_alerts context processor and
+        the navigation builder all ask for it while rendering one request.
         """
         from inclusive_world_portal.portal.models import RoleEnrollmentRequirement
         
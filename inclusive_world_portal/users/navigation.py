@@ -4,6 +4,9 @@ Navigation configuration for role-based sidebar menus.
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+from inclusive_world_portal.portal.models import EnrollmentSettings, ProgramVolunteerLead
+from inclusive_world_portal.portal.reversers import frozen_url
+
 
 def get_navigation_items(user):
     """
@@ -21,8 +24,6 @@ def get_navigation_items(user):
     # Member navigation
     if role == 'member':
         # Determine registration status for better UI feedback
-        from inclusive_world_portal.portal.models import EnrollmentSettings
-        
         enrollment_settings = EnrollmentSettings.get_settings()
         enrollment_open = enrollment_settings.enrollment_open
         can_register = user.can_purchase_programs
@@ -33,7 +34,7 @@ def get_navigation_items(user):
         if can_register:
             # Requirements met and enrollment open
             registration_status = 'open'
-            registration_url = reverse('portal:program_catalog')
+            registration_url = frozen_url('portal:program_catalog')
             registration_tooltip = _('Registration is open')
         elif not meets_requirements:
             # Requirements not met
@@ -49,18 +50,18 @@ def get_navigation_items(user):
         nav_items = [
             {
                 'label': _('Dashboard'),
-                'url': reverse('users:member_dashboard'),
+                'url': frozen_url('users:member_dashboard'),
                 'icon_class': 'bi bi-house-door',
             },
             {
                 'label': _('Notifications'),
-                'url': reverse('users:notification_list'),
+                'url': frozen_url('users:notification_list'),
                 'icon_class': 'bi bi-bell',
                 'show_notification_badge': True,
             },
             {
                 'label': _('Documents'),
-                'url': reverse('users:document_list'),
+                'url': frozen_url('users:document_list'),
                 'icon_class': 'bi bi-file-earmark-text',
             },
             {
@@ -80,12 +81,12 @@ def get_navigation_items(user):
             },
             {
                 'label': _('Programs'),
-                'url': reverse('portal:programs'),
+                'url': frozen_url('portal:programs'),
                 'icon_class': 'bi bi-layers',
             },
             {
                 'label': _('My Attendance'),
-                'url': reverse('portal:my_attendance'),
+                'url': frozen_url('portal:my_attendance'),
                 'icon_class': 'bi bi-calendar-check',
             },
             {
@@ -99,8 +100,6 @@ def get_navigation_items(user):
     # Volunteer navigation - Same as member but without payment requirements
     elif role == 'volunteer':
         # Determine registration status for better UI feedback
-        from inclusive_world_portal.portal.models import EnrollmentSettings, ProgramVolunteerLead
-        
         enrollment_settings = EnrollmentSettings.get_settings()
         enrollment_open = enrollment_settings.enrollment_open
         meets_requirements, missing_items = user.enrollment_requirements_status
@@ -112,7 +111,7 @@ def get_navigation_items(user):
         if can_register:
             # Requirements met and enrollment open
             registration_status = 'open'
-            registration_url = reverse('portal:volunteer_program_catalog')
+            registration_url = frozen_url('portal:volunteer_program_catalog')
             registration_tooltip = _('Registration is open')
         elif not meets_requirements:
             # Requirements not met
@@ -131,18 +130,18 @@ def get_navigation_items(user):
         nav_items = [
             {
                 'label': _('Dashboard'),
-                'url': reverse('users:volunteer_dashboard'),
+                'url': frozen_url('users:volunteer_dashboard'),
                 'icon_class': 'bi bi-house-door',
             },
             {
                 'label': _('Notifications'),
-                'url': reverse('users:notification_list'),
+                'url': frozen_url('users:notification_list'),
                 'icon_class': 'bi bi-bell',
                 'show_notification_badge': True,
             },
             {
                 'label': _('Documents'),
-                'url': reverse('users:document_list'),
+                'url': frozen_url('users:document_list'),
                 'icon_class': 'bi bi-file-earmark-text',
             },
             {
@@ -162,12 +161,12 @@ def get_navigation_items(user):
             },
             {
                 'label': _('Programs'),
-                'url': reverse('portal:programs'),
+                'url': frozen_url('portal:programs'),
                 'icon_class': 'bi bi-layers',
             },
             {
                 'label': _('My Attendance'),
-                'url': reverse('portal:my_attendance'),
+                'url': frozen_url('portal:my_attendance'),
                 'icon_class': 'bi bi-calendar-check',
             },
         ]
@@ -177,12 +176,12 @@ def get_navigation_items(user):
             nav_items.extend([
                 {
                     'label': _('Members'),
-                    'url': reverse('portal:all_members'),
+                    'url': frozen_url('portal:all_members'),
                     'icon_class': 'bi bi-people',
                 },
                 {
                     'label': _('Volunteers'),
-                    'url': reverse('portal:all_volunteers'),
+                    'url': frozen_url('portal:all_volunteers'),
                     'icon_class': 'bi bi-people-fill',
                 },
             ])
@@ -198,8 +197,6 @@ def get_navigation_items(user):
     # Person Centered Manager navigation - Same as manager with program registration capability
     elif role == 'person_centered_manager':
         # Determine registration status for better UI feedback
-        from inclusive_world_portal.portal.models import EnrollmentSettings
-        
         enrollment_settings = EnrollmentSettings.get_settings()
         enrollment_open = enrollment_settings.enrollment_open
         meets_requirements, missing_items = user.enrollment_requirements_status
@@ -211,7 +208,7 @@ def get_navigation_items(user):
         if can_register:
             # Requirements met and enrollment open
             registration_status = 'open'
-            registration_url = reverse('portal:volunteer_program_catalog')
+            registration_url = frozen_url('portal:volunteer_program_catalog')
             registration_tooltip = _('Registration is open')
         elif not meets_requirements:
             # Requirements not met
@@ -227,18 +224,18 @@ def get_navigation_items(user):
         return [
             {
                 'label': _('Dashboard'),
-                'url': reverse('users:pcm_dashboard'),
+                'url': frozen_url('users:pcm_dashboard'),
                 'icon_class': 'bi bi-house-door',
             },
             {
                 'label': _('Notifications'),
-                'url': reverse('users:notification_list'),
+                'url': frozen_url('users:notification_list'),
                 'icon_class': 'bi bi-bell',
                 'show_notification_badge': True,
             },
             {
                 'label': _('Documents'),
-                'url': reverse('users:document_list'),
+                'url': frozen_url('users:document_list'),
                 'icon_class': 'bi bi-file-earmark-text',
             },
             {
@@ -258,22 +255,22 @@ def get_navigation_items(user):
             },
             {
                 'label': _('Programs'),
-                'url': reverse('portal:programs'),
+                'url': frozen_url('portal:programs'),
                 'icon_class': 'bi bi-layers',
             },
             {
                 'label': _('My Attendance'),
-                'url': reverse('portal:my_attendance'),
+                'url': frozen_url('portal:my_attendance'),
                 'icon_class': 'bi bi-calendar-check',
             },
             {
                 'label': _('Members'),
-                'url': reverse('portal:all_members'),
+                'url': frozen_url('portal:all_members'),
                 'icon_class': 'bi bi-people',
             },
             {
                 'label': _('Volunteers'),
-                'url': reverse('portal:all_volunteers'),
+                'url': frozen_url('portal:all_volunteers'),
                 'icon_class': 'bi bi-people-fill',
             },
             {
@@ -286,8 +283,6 @@ def get_navigation_items(user):
     # Manager navigation - Same as volunteer but with additional Manage Programs option
     elif role == 'manager':
         # Determine registration status for better UI feedback
-        from inclusive_world_portal.portal.models import EnrollmentSettings
-        
         enrollment_settings = EnrollmentSettings.get_settings()
         enrollment_open = enrollment_settings.enrollment_open
         meets_requirements, missing_items = user.enrollment_requirements_status
@@ -299,7 +294,7 @@ def get_navigation_items(user):
         if can_register:
             # Requirements met and enrollment open
             registration_status = 'open'
-            registration_url = reverse('portal:volunteer_program_catalog')
+            registration_url = frozen_url('portal:volunteer_program_catalog')
             registration_tooltip = _('Registration is open')
         elif not meets_requirements:
             # Requirements not met
@@ -315,18 +310,18 @@ def get_navigation_items(user):
         nav_items = [
             {
                 'label': _('Dashboard'),
-                'url': reverse('users:manager_dashboard'),
+                'url': frozen_url('users:manager_dashboard'),
                 'icon_class': 'bi bi-house-door',
             },
             {
                 'label': _('Notifications'),
-                'url': reverse('users:notification_list'),
+                'url': frozen_url('users:notification_list'),
                 'icon_class': 'bi bi-bell',
                 'show_notification_badge': True,
             },
             {
                 'label': _('Documents'),
-                'url': reverse('users:document_list'),
+                'url': frozen_url('users:document_list'),
                 'icon_class': 'bi bi-file-earmark-text',
             },
             {
@@ -346,27 +341,27 @@ def get_navigation_items(user):
             },
             {
                 'label': _('Programs'),
-                'url': reverse('portal:programs'),
+                'url': frozen_url('portal:programs'),
                 'icon_class': 'bi bi-layers',
             },
             {
                 'label': _('My Attendance'),
-                'url': reverse('portal:my_attendance'),
+                'url': frozen_url('portal:my_attendance'),
                 'icon_class': 'bi bi-calendar-check',
             },
             {
                 'label': _('Members'),
-                'url': reverse('portal:all_members'),
+                'url': frozen_url('portal:all_members'),
                 'icon_class': 'bi bi-people',
             },
             {
                 'label': _('Volunteers'),
-                'url': reverse('portal:all_volunteers'),
+                'url': frozen_url('portal:all_volunteers'),
                 'icon_class': 'bi bi-people-fill',
             },
             {
                 'label': _('Enrollment Settings'),
-                'url': reverse('portal:enrollment_settings'),
+                'url': frozen_url('portal:enrollment_settings'),
                 'icon_class': 'bi bi-gear',
             },
             {
@@ -178,34 +178,30 @@ class CreateBulkNotificationView(LoginRequiredMixin, UserPassesTestMixin, FormVi
         description = form.cleaned_data['description']
         level = form.cleaned_data['level']
         
-        # Determine recipients
-        recipients: list[User] = []
+        # Determine recipients: fold role / program / explicit-user targeting
+        # into one OR'd query instead of three queries merged in Python
+        target_roles = form.cleaned_data.get('target_roles', [])
+        target_programs = form.cleaned_data.get('target_programs', [])
+        target_users = form.cleaned_data.get('target_users', [])
         
+        recipient_filter = Q()
         # Add users by role
-        target_roles = form.cleaned_data.get('target_roles', [])
         if target_roles:
-            recipients.extend(
-                User.objects.filter(role__in=target_roles, status=User.Status.ACTIVE)
-            )
-        
-        # Add users by program
-        target_programs = form.cleaned_data.get('target_programs', [])
+            recipient_filter |= Q(role__in=target_roles, status=User.Status.ACTIVE)
+        # Add users enrolled (approved) in these programs
         if target_programs:
-            # Get users enrolled in these programs
-            from inclusive_world_portal.portal.models import Enrollment
-            program_users = User.objects.filter(
+            recipient_filter |= Q(
                 enrollments__program__in=target_programs,
-                enrollments__status='approved'
-            ).distinct()
-            recipients.extend(program_users)
-        
+                enrollments__status='approved',
+            )
         # Add specific users
-        target_users = form.cleaned_data.get('target_users', [])
         if target_users:
-            recipients.extend(target_users)
+            recipient_filter |= Q(pk__in=target_users)
+        
+        recipients: list[User] = (
+            list(User.objects.filter(recipient_filter).distinct()) if recipient_filter else []
+        )
         
-        # Remove duplicates
-        recipients = list(set(recipients))
         # Ensure requester is included if they selected their own role and are active
         if target_roles and hasattr(self.request.user, 'role') and hasattr(self.request.user, 'status') and \
            self.request.user.role in target_roles and self.request.user.status == User.Status.ACTIVE:
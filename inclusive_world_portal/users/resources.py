@@ -1,5 +1,6 @@
 """Import/Export resources for user models."""
 from import_export import resources, fields
+from import_export.instance_loaders import CachedInstanceLoader
 from import_export.widgets import DateWidget
 from .models import User
 
@@ -31,3 +32,10 @@ class UserResource(resources.ModelResource):
         report_skipped = True
         # Exclude password field for security
         exclude = ('password',)
+        # Roster imports are the bulk path: load existing users by username in
+        # one query and write new/changed rows with bulk_create/bulk_update
+        # instead of a lookup + INSERT/UPDATE per row. User has no save()
+        # override or post_save receivers that this would bypass.
+        instance_loader_class = CachedInstanceLoader
+        use_bulk = True
+        batch_size = 500